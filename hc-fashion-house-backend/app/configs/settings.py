@@ -62,6 +62,20 @@ class Settings(BaseSettings):
         description="SQLite database path (relative to app directory)"
     )
 
+    # Connection pool (PostgreSQL only). Keep these small per worker - with
+    # Supabase, point DATABASE_URL at the Supavisor transaction pooler (:6543)
+    DB_POOL_SIZE: int = Field(default=10, description="Persistent connections per worker")
+    DB_MAX_OVERFLOW: int = Field(default=0, description="Extra connections allowed above pool size")
+    DB_POOL_RECYCLE: int = Field(default=1800, description="Recycle connections after this many seconds")
+    # SQLite connections are cheap and WAL lets them read concurrently, so size
+    # the pool to FastAPI's threadpool (40 threads) - sync endpoints then
+    # never queue on connection checkout
+    SQLITE_POOL_SIZE: int = Field(default=40, description="Pooled SQLite connections per worker")
+    DEBUG_ORM: bool = Field(
+        default=False,
+        description="Raise on lazy relationship loads in listing/availability queries (catches N+1 regressions)"
+    )
+
     # ========================
     # Supabase Auth Settings
     # ========================
@@ -80,6 +94,18 @@ class Settings(BaseSettings):
         description="Supabase service role key (for admin operations)"
     )
 
+    SUPABASE_JWT_SECRET: Optional[str] = Field(
+        default=None,
+        description="Supabase legacy JWT secret (HS256) - enables local token verification"
+    )
+
+    # HTTP connection pool shared by each Supabase client (keep-alive reuse)
+    SUPABASE_HTTP_MAX_CONNECTIONS: int = Field(default=100, description="Max open connections to Supabase")
+    SUPABASE_HTTP_MAX_KEEPALIVE: int = Field(default=50, description="Max idle keep-alive connections to Supabase")
+    SUPABASE_HTTP_KEEPALIVE_EXPIRY: float = Field(default=30.0, description="Idle keep-alive expiry in seconds")
+    SUPABASE_HTTP_TIMEOUT: float = Field(default=10.0, description="Supabase request timeout in seconds")
+    SUPABASE_HTTP_CONNECT_TIMEOUT: float = Field(default=3.0, description="Supabase connect timeout in seconds")
+
     # ========================
     # OTP Settings - Day 2 Feature
     # ========================
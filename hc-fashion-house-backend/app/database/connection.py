@@ -1,27 +1,66 @@
 """
-Database connection and session management for SQLite
+Database connection and session management
+SQLite by default; PostgreSQL when DATABASE_URL is set
 """
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
+from configs.settings import get_settings
+
+settings = get_settings()
+
 # Get the directory where this file is located
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATABASE_PATH = os.path.join(BASE_DIR, "database", "ecommerce.db")
 
-# Ensure database directory exists
-os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+# Database URL (falls back to the local SQLite file)
+SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL or f"sqlite:///{DATABASE_PATH}"
+IS_SQLITE = SQLALCHEMY_DATABASE_URL.startswith("sqlite")
+
+if IS_SQLITE:
+    # Ensure database directory exists
+    os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
+
+    # Create engine with SQLite-specific settings
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        connect_args={"check_same_thread": False},  # Required for SQLite
+        # The default pool (5 + 10 overflow) is smaller than the threadpool
+        # running sync endpoints; size it so listing bursts don't wait on checkout
+        pool_size=settings.SQLITE_POOL_SIZE,
+        max_overflow=0,
+        echo=False  # Set to True for SQL query logging
+    )
+else:
+    # Capped pool per worker; pre-ping and recycle drop connections the
+    # pooler (Supavisor) has closed. psycopg2 doesn't use server-side
+    # prepared statements, so transaction-mode pooling is safe.
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        echo=False
+    )
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    WAL lets readers run concurrently with a writer (the default rollback
+    journal blocks all reads during a write), so threadpool-dispatched
+    catalogue reads don't serialize behind admin writes.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, fewer fsyncs
+    cursor.close()
 
-# SQLite connection URL
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
-# Create engine with SQLite-specific settings
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Required for SQLite
-    echo=False  # Set to True for SQL query logging
-)
+if IS_SQLITE:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
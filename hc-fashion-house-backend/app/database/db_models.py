@@ -12,9 +12,9 @@ Key Concepts:
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean, DateTime,
-    ForeignKey, UniqueConstraint, Table
+    ForeignKey, UniqueConstraint, Index, Table, func, select, text
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
 from database.connection import Base
 
 
@@ -88,7 +88,7 @@ class Category(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
     slug = Column(String(255), nullable=False, unique=True)
-    platform_id = Column(Integer, ForeignKey("platforms.id"), nullable=False)
+    platform_id = Column(Integer, ForeignKey("platforms.id"), nullable=False, index=True)
     parent_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -100,6 +100,11 @@ class Category(Base):
     products = relationship("Product", secondary=product_categories, back_populates="categories")
     catalogues = relationship("Catalogue", back_populates="category")
 
+    __table_args__ = (
+        # Child/root category listings filter by parent and active flag
+        Index('ix_categories_parent_active', 'parent_id', 'is_active'),
+    )
+
 
 class Catalogue(Base):
     """
@@ -127,6 +132,11 @@ class Catalogue(Base):
     category = relationship("Category", back_populates="catalogues")
     banner_media = relationship("MediaAsset", foreign_keys=[banner_media_id])
 
+    __table_args__ = (
+        # Catalogue listings filter by category, then gender/active flag
+        Index('ix_catalogues_category_gender_active', 'category_id', 'gender', 'is_active'),
+    )
+
 
 class Product(Base):
     """
@@ -141,7 +151,7 @@ class Product(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)  # e.g., "AirFlex Running Shoe - Red"
     slug = Column(String(255), nullable=False, unique=True)
-    brand_id = Column(Integer, ForeignKey("brands.id"), nullable=True)
+    brand_id = Column(Integer, ForeignKey("brands.id"), nullable=True, index=True)
     catalogue_id = Column(Integer, ForeignKey("catalogues.id"), nullable=False)  # Required - Article/design reference
     color = Column(String(100), nullable=True)  # Display color name (e.g., "White/Skyblue")
     color_hex = Column(String(50), nullable=True)  # Hex codes (e.g., "#FFFFFF,#87CEEB" for multi-color)
@@ -153,6 +163,7 @@ class Product(Base):
     specifications = Column(Text, nullable=True)  # Product specifications (e.g., material, care instructions)
     is_featured = Column(Boolean, default=False)  # Deprecated: Use tags instead
     tags = Column(Text, nullable=True)  # Comma-separated tags: new,trending,featured,bestseller,sale
+    primary_image_url = Column(Text, nullable=True)  # Denormalized from the primary MediaAsset (see sync_primary_image)
     status = Column(String(20), default="draft")  # draft | live | archived
     meta_title = Column(String(255), nullable=True)
     meta_description = Column(Text, nullable=True)
@@ -167,6 +178,23 @@ class Product(Base):
     variants = relationship("ProductVariant", back_populates="product", cascade="all, delete-orphan")
     media_assets = relationship("MediaAsset", back_populates="product", cascade="all, delete-orphan")
     footwear_details = relationship("FootwearDetails", back_populates="product", cascade="all, delete-orphan", uselist=False)
+    tag_rows = relationship("ProductTag", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Color switching / catalogue pages: live products of one catalogue
+        Index('ix_products_catalogue_status', 'catalogue_id', 'status'),
+        # Storefront listings: live products, optionally featured or by price range
+        Index('ix_products_status_featured', 'status', 'is_featured'),
+        Index('ix_products_status_price', 'status', 'price'),
+        # Storefront listing order (featured first, newest first, id as the
+        # keyset tiebreaker) over live, non-deleted products - lets LIMIT and
+        # cursor pages read the index in order
+        Index(
+            'ix_product_listing', is_featured.desc(), created_at.desc(), id.desc(),
+            sqlite_where=text("deleted_at IS NULL AND status = 'live'"),
+            postgresql_where=text("deleted_at IS NULL AND status = 'live'"),
+        ),
+    )
 
     def get_tags_list(self) -> list:
         """Get tags as a list"""
@@ -196,6 +224,22 @@ class Product(Base):
         return [cat.id for cat in self.categories] if self.categories else []
 
 
+class ProductTag(Base):
+    """
+    One row per product tag, mirroring the comma-separated Product.tags.
+    Used for indexed tag filtering; Product.tags stays the source for display.
+    """
+    __tablename__ = "product_tags"
+
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(100), primary_key=True)
+
+    __table_args__ = (
+        # Tag filters: seek by tag, read product ids from the index
+        Index('ix_product_tags_tag_product', 'tag', 'product_id'),
+    )
+
+
 class ProductVariant(Base):
     """
     Represents size/style variations of a product.
@@ -228,7 +272,7 @@ class VariantOption(Base):
     __tablename__ = "variant_options"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    variant_id = Column(Integer, ForeignKey("product_variants.id"), nullable=False)
+    variant_id = Column(Integer, ForeignKey("product_variants.id", ondelete="CASCADE"), nullable=False, index=True)
     option_name = Column(String(100), nullable=False)  # size | waist | length
     option_value = Column(String(100), nullable=False)  # 9 | XL | 42cm
     stock_quantity = Column(Integer, default=0)
@@ -238,6 +282,32 @@ class VariantOption(Base):
     variant = relationship("ProductVariant", back_populates="options")
 
 
+# Total stock across a variant's options, computed in SQL so callers don't
+# need to load every option row just to sum them. Deferred: queries that read
+# it undefer() it, other variant loads skip the correlated subquery.
+# Defined here because it references VariantOption.
+ProductVariant.total_stock = column_property(
+    select(func.coalesce(func.sum(VariantOption.stock_quantity), 0))
+    .where(VariantOption.variant_id == ProductVariant.id)
+    .correlate_except(VariantOption)
+    .scalar_subquery(),
+    deferred=True
+)
+
+# Value of the variant's "size" option, the fallback when variant_name is
+# empty, likewise read in SQL instead of scanning the loaded options (and
+# likewise deferred).
+ProductVariant.size_option_value = column_property(
+    select(VariantOption.option_value)
+    .where(VariantOption.variant_id == ProductVariant.id, VariantOption.option_name == "size")
+    .order_by(VariantOption.id)
+    .limit(1)
+    .correlate_except(VariantOption)
+    .scalar_subquery(),
+    deferred=True
+)
+
+
 class MediaAsset(Base):
     """
     Stores all images, banners, and videos.
@@ -247,7 +317,7 @@ class MediaAsset(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=True)
-    variant_id = Column(Integer, ForeignKey("product_variants.id"), nullable=True)
+    variant_id = Column(Integer, ForeignKey("product_variants.id", ondelete="CASCADE"), nullable=True)
     media_type = Column(String(20), nullable=False)  # image | video
     usage_type = Column(String(50), nullable=False)  # catalogue | lifestyle | banner
     platform = Column(String(50), nullable=True)  # website | instagram | ads
@@ -260,6 +330,7 @@ class MediaAsset(Base):
     display_order = Column(Integer, default=0)
     is_primary = Column(Boolean, default=False)
     status = Column(String(20), default="approved")
+    content_sha256 = Column(String(64), nullable=True, index=True)  # Upload dedup (see MediaUploadService.hash_upload)
     created_at = Column(DateTime, default=datetime.utcnow)
     deleted_at = Column(DateTime, nullable=True)  # Soft delete support
 
@@ -267,6 +338,29 @@ class MediaAsset(Base):
     product = relationship("Product", back_populates="media_assets")
     variant = relationship("ProductVariant", back_populates="media_assets")
 
+    __table_args__ = (
+        # At most one live primary per product and usage type; also serves
+        # the primary-image lookups in listings
+        Index(
+            'ix_media_primary_per_product', 'product_id', 'usage_type',
+            unique=True,
+            sqlite_where=text('is_primary = 1 AND deleted_at IS NULL'),
+            postgresql_where=text('is_primary AND deleted_at IS NULL'),
+        ),
+        # Primary-only lookups used to clear the current primary before a new
+        # one is set (these filters don't exclude soft-deleted rows)
+        Index(
+            'ix_media_primary_by_product', 'product_id', 'usage_type',
+            sqlite_where=text('is_primary = 1'),
+            postgresql_where=text('is_primary'),
+        ),
+        Index(
+            'ix_media_primary_by_variant', 'variant_id', 'usage_type',
+            sqlite_where=text('is_primary = 1'),
+            postgresql_where=text('is_primary'),
+        ),
+    )
+
 
 class FootwearDetails(Base):
     """
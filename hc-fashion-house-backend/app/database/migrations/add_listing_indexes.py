@@ -0,0 +1,46 @@
+"""
+Migration: Add composite indexes for listing filters
+- products (catalogue_id, status): color options / catalogue pages (live SKUs)
+- products (status, is_featured): featured sections on the storefront
+- products (status, price): storefront listings with a price range
+- categories (parent_id, is_active): child and root category listings
+- catalogues (category_id, gender, is_active): catalogue listings
+
+platform_id and brand_id filters are served by the single-column indexes from
+add_lookup_indexes.py.
+"""
+import sqlite3
+from pathlib import Path
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_products_catalogue_status ON products (catalogue_id, status)",
+    "CREATE INDEX IF NOT EXISTS ix_products_status_featured ON products (status, is_featured)",
+    "CREATE INDEX IF NOT EXISTS ix_products_status_price ON products (status, price)",
+    "CREATE INDEX IF NOT EXISTS ix_categories_parent_active ON categories (parent_id, is_active)",
+    "CREATE INDEX IF NOT EXISTS ix_catalogues_category_gender_active ON catalogues (category_id, gender, is_active)",
+]
+
+
+def migrate():
+    """Run the migration"""
+    db_path = Path(__file__).parent.parent / "ecommerce.db"
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        for statement in INDEXES:
+            cursor.execute(statement)
+
+        conn.commit()
+        print(f"✅ Migration successful: Created {len(INDEXES)} listing indexes")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,42 @@
+"""
+Migration: Add indexes on foreign keys used for lookups and delete guards
+- categories.platform_id (list categories by platform, delete_platform check)
+- products.brand_id (filter products by brand, delete_brand check)
+- variant_options.variant_id (ProductVariant.total_stock subquery, option loads)
+
+Slug columns are already UNIQUE (and therefore indexed). Supabase role and
+user_roles lookups are covered by supabase_schema.sql.
+"""
+import sqlite3
+from pathlib import Path
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_categories_platform_id ON categories (platform_id)",
+    "CREATE INDEX IF NOT EXISTS ix_products_brand_id ON products (brand_id)",
+    "CREATE INDEX IF NOT EXISTS ix_variant_options_variant_id ON variant_options (variant_id)",
+]
+
+
+def migrate():
+    """Run the migration"""
+    db_path = Path(__file__).parent.parent / "ecommerce.db"
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        for statement in INDEXES:
+            cursor.execute(statement)
+
+        conn.commit()
+        print(f"✅ Migration successful: Created {len(INDEXES)} lookup indexes")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,43 @@
+"""
+Migration: Add content_sha256 column to media_assets
+SHA-256 of the uploaded bytes, used to skip re-uploading a file that is
+already stored for the same product and usage type. Existing rows stay NULL
+(their content is only in R2) and are simply never matched.
+"""
+import sqlite3
+from pathlib import Path
+
+
+def migrate():
+    """Run the migration"""
+    db_path = Path(__file__).parent.parent / "ecommerce.db"
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(media_assets)")
+        columns = [column[1] for column in cursor.fetchall()]
+
+        if "content_sha256" not in columns:
+            cursor.execute("ALTER TABLE media_assets ADD COLUMN content_sha256 VARCHAR(64)")
+            print("✅ Added content_sha256 column to media_assets")
+        else:
+            print("✅ content_sha256 column already exists")
+
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_media_assets_content_sha256 ON media_assets (content_sha256)"
+        )
+
+        conn.commit()
+        print("✅ Migration successful: Created ix_media_assets_content_sha256")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,42 @@
+"""
+Migration: Add partial indexes for clearing the current primary media
+- media_assets (product_id, usage_type) WHERE is_primary = 1
+- media_assets (variant_id, usage_type) WHERE is_primary = 1
+
+Only primary rows are indexed, so the UPDATE in _unset_primary_media /
+_clear_primary is a point lookup instead of a scan of media_assets.
+"""
+import sqlite3
+from pathlib import Path
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_media_primary_by_product ON media_assets (product_id, usage_type) "
+    "WHERE is_primary = 1",
+    "CREATE INDEX IF NOT EXISTS ix_media_primary_by_variant ON media_assets (variant_id, usage_type) "
+    "WHERE is_primary = 1",
+]
+
+
+def migrate():
+    """Run the migration"""
+    db_path = Path(__file__).parent.parent / "ecommerce.db"
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        for statement in INDEXES:
+            cursor.execute(statement)
+
+        conn.commit()
+        print(f"✅ Migration successful: Created {len(INDEXES)} primary media indexes")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,48 @@
+"""
+Migration: Enforce at most one primary media per product and usage type
+Clears duplicate primaries (the lowest id is kept, matching the listing's
+primary image choice) and adds the partial unique index
+ix_media_primary_per_product.
+"""
+import sqlite3
+from pathlib import Path
+
+
+def migrate():
+    """Run the migration"""
+    db_path = Path(__file__).parent.parent / "ecommerce.db"
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            UPDATE media_assets SET is_primary = 0
+            WHERE is_primary = 1 AND deleted_at IS NULL AND product_id IS NOT NULL
+              AND id NOT IN (
+                SELECT MIN(id) FROM media_assets
+                WHERE is_primary = 1 AND deleted_at IS NULL AND product_id IS NOT NULL
+                GROUP BY product_id, usage_type
+              )
+        """)
+        cleared = cursor.rowcount
+
+        cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_media_primary_per_product
+            ON media_assets (product_id, usage_type)
+            WHERE is_primary = 1 AND deleted_at IS NULL
+        """)
+
+        conn.commit()
+        print("✅ Migration successful: Created ix_media_primary_per_product")
+        print(f"✅ Cleared {cleared} duplicate primary media flags")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,43 @@
+"""
+Migration: Add partial index for the storefront listing order
+- products (is_featured DESC, created_at DESC, id DESC) WHERE deleted_at IS NULL AND status = 'live'
+
+Matches the listing's ORDER BY so a LIMIT page is read off the index instead
+of sorting every live product; id is the keyset cursor's tiebreaker. The
+index is dropped and recreated, so re-running upgrades an older two-column
+index. catalogue_id and brand_id filters are served by add_listing_indexes.py
+/ add_lookup_indexes.py.
+"""
+import sqlite3
+from pathlib import Path
+
+INDEXES = [
+    "DROP INDEX IF EXISTS ix_product_listing",
+    "CREATE INDEX ix_product_listing ON products (is_featured DESC, created_at DESC, id DESC) "
+    "WHERE deleted_at IS NULL AND status = 'live'",
+]
+
+
+def migrate():
+    """Run the migration"""
+    db_path = Path(__file__).parent.parent / "ecommerce.db"
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        for statement in INDEXES:
+            cursor.execute(statement)
+
+        conn.commit()
+        print("✅ Migration successful: Created listing order index")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,48 @@
+"""
+Migration: Add primary_image_url column to products
+Denormalized copy of the product's primary media URL (lowest id wins), so
+storefront listings read it from the product row instead of media_assets.
+"""
+import sqlite3
+from pathlib import Path
+
+
+def migrate():
+    """Run the migration"""
+    db_path = Path(__file__).parent.parent / "ecommerce.db"
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(products)")
+        columns = [column[1] for column in cursor.fetchall()]
+
+        if "primary_image_url" not in columns:
+            cursor.execute("ALTER TABLE products ADD COLUMN primary_image_url TEXT")
+            print("✅ Added primary_image_url column to products")
+        else:
+            print("✅ primary_image_url column already exists")
+
+        # Backfill from the current primary media
+        cursor.execute("""
+            UPDATE products SET primary_image_url = (
+                SELECT cloudinary_url FROM media_assets
+                WHERE media_assets.product_id = products.id
+                  AND is_primary = 1 AND deleted_at IS NULL
+                ORDER BY id LIMIT 1
+            )
+        """)
+
+        conn.commit()
+        print(f"✅ Migration successful: Backfilled primary_image_url for {cursor.rowcount} products")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,54 @@
+"""
+Migration: Add product_tags table for indexed tag filtering
+One row per (product, tag), backfilled from the comma-separated products.tags.
+products.tags is kept as the source for display.
+"""
+import sqlite3
+from pathlib import Path
+
+
+def migrate():
+    """Run the migration"""
+    db_path = Path(__file__).parent.parent / "ecommerce.db"
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS product_tags (
+                product_id INTEGER NOT NULL,
+                tag VARCHAR(100) NOT NULL,
+                PRIMARY KEY (product_id, tag),
+                FOREIGN KEY (product_id) REFERENCES products(id) ON DELETE CASCADE
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_product_tags_tag_product ON product_tags (tag, product_id)"
+        )
+
+        # Backfill from the existing tag strings (same normalization as Product.get_tags_list)
+        rows = cursor.execute("SELECT id, tags FROM products WHERE tags IS NOT NULL").fetchall()
+        tag_rows = {
+            (product_id, tag.strip().lower())
+            for product_id, tags in rows
+            for tag in tags.split(',') if tag.strip()
+        }
+        cursor.executemany(
+            "INSERT OR IGNORE INTO product_tags (product_id, tag) VALUES (?, ?)",
+            sorted(tag_rows)
+        )
+
+        conn.commit()
+        print("✅ Migration successful: Created product_tags table")
+        print(f"✅ Backfilled {len(tag_rows)} product tag rows")
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ Migration failed: {e}")
+        raise
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -94,6 +94,8 @@ CREATE TABLE IF NOT EXISTS public.user_audit_log (
 CREATE INDEX IF NOT EXISTS idx_user_audit_log_user_id ON public.user_audit_log(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_audit_log_action ON public.user_audit_log(action);
 CREATE INDEX IF NOT EXISTS idx_user_audit_log_created_at ON public.user_audit_log(created_at DESC);
+-- Serves both the per-user count and the ORDER BY created_at DESC page query
+CREATE INDEX IF NOT EXISTS idx_user_audit_log_user_created ON public.user_audit_log(user_id, created_at DESC);
 
 -- ============================================
 -- 7. ENABLE ROW LEVEL SECURITY (RLS)
@@ -26,7 +26,9 @@ from routers.v1.auth_router import router as auth_router
 # Site Configuration router (Website Control Center)
 from routers.v1.site_config import router as site_config_router
 
+from services.auth_service import AuditService
 from utils.exceptions import EcommerceException
+from utils.logging_config import start_log_listener, stop_log_listener
 
 # Define allowed origins
 origins = [
@@ -46,19 +48,31 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting E-Commerce Catalogue Service")
 
+    # Write log records from a background thread, not the request path
+    start_log_listener()
+
     # Initialize SQLite database
     print("📦 Initializing SQLite database...")
     init_db()
     print("✅ Database initialized successfully!")
 
+    # Start background audit log writer
+    AuditService.start_writer()
+
     print("🎉 E-Commerce service is ready!")
     yield
 
     # Shutdown
     print("👋 Shutting down E-Commerce Catalogue Service")
+    await AuditService.stop_writer()
+    stop_log_listener()
 
 
 # Create FastAPI app
+# NOTE: Keep the default JSONResponse. Endpoints with a response_model are
+# serialized straight to JSON bytes by Pydantic's Rust core; setting a custom
+# default_response_class (e.g. ORJSONResponse) disables that fast path and
+# falls back to jsonable_encoder + a second serialization pass.
 app = FastAPI(
     title="E-Commerce Catalogue API",
     description="""
@@ -8,10 +8,19 @@ Schema Hierarchy:
 from datetime import datetime
 from typing import Optional, List
 from enum import Enum
+from functools import lru_cache
 from pydantic import BaseModel, Field, field_validator, model_validator
 import re
 
 
+# Precompiled patterns for slug/SKU normalization and validation
+SLUG_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+SLUG_SEPARATOR_PATTERN = re.compile(r'[\s_]+')
+DASH_RUN_PATTERN = re.compile(r'-+')
+SKU_STRIP_PATTERN = re.compile(r'[^A-Z0-9-]')
+HEX_COLOR_PATTERN = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+
 # ========================
 # Enums
 # ========================
@@ -53,12 +62,13 @@ class MediaPlatform(str, Enum):
 # Utility Functions
 # ========================
 
+@lru_cache(maxsize=1024)
 def generate_slug(name: str) -> str:
     """Generate URL-safe slug from name"""
     slug = name.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
+    slug = SLUG_STRIP_PATTERN.sub('', slug)
+    slug = SLUG_SEPARATOR_PATTERN.sub('-', slug)
+    slug = DASH_RUN_PATTERN.sub('-', slug)
     return slug.strip('-')
 
 
@@ -332,9 +342,9 @@ class ProductVariantCreate(ProductVariantBase):
         if v is None:
             return v
         # Normalize: uppercase, strip, remove invalid chars
-        v = re.sub(r'[^A-Z0-9-]', '', v.upper().strip())
+        v = SKU_STRIP_PATTERN.sub('', v.upper().strip())
         # Remove leading/trailing/consecutive dashes
-        v = re.sub(r'-+', '-', v).strip('-')
+        v = DASH_RUN_PATTERN.sub('-', v).strip('-')
         if not v:
             return None  # Return None if SKU becomes empty after cleanup
         return v
@@ -416,7 +426,7 @@ class ProductBase(BaseModel):
         """Validate hex color format"""
         if v is None:
             return v
-        if not re.match(r'^#[0-9A-Fa-f]{6}$', v):
+        if not HEX_COLOR_PATTERN.match(v):
             raise ValueError('Color hex must be in format #RRGGBB')
         return v.upper()
 
@@ -662,11 +672,12 @@ class ProductListingItem(BaseModel):
 class ProductListingResponse(BaseModel):
     """Paginated product listing response"""
     items: List[ProductListingItem]
-    total: int
+    total: Optional[int] = None  # None on cursor pages (counted on the first page only)
     page: int
     per_page: int
-    pages: int
+    pages: Optional[int] = None
     filters_applied: dict = {}
+    next_cursor: Optional[str] = None
 
 
 # ========================
@@ -129,6 +129,11 @@ class BulkDisplayOrderUpdate(BaseModel):
         return v
 
 
+class BulkMediaDelete(BaseModel):
+    """Request model for bulk media deletion"""
+    media_ids: List[int] = Field(..., min_length=1, description="Media asset IDs to delete")
+
+
 # ========================
 # Response Models
 # ========================
@@ -173,6 +178,14 @@ class MediaDeleteResponse(BaseModel):
     cloudinary_deleted: bool
 
 
+class BulkMediaDeleteResponse(BaseModel):
+    """Response model for bulk media deletion"""
+    success: bool
+    message: str
+    deleted_ids: List[int]
+    r2_deleted: int
+
+
 class BulkUploadResponse(BaseModel):
     """Response model for bulk media upload"""
     total: int
@@ -476,7 +476,7 @@ def get_product_listing(
     Returns product data with primary_image_url pre-joined to avoid N+1 queries.
     """
     skip = (page - 1) * per_page
-    items, total, filters_applied = ProductListingService.get_product_listing(
+    items, total, filters_applied, _ = ProductListingService.get_product_listing(
         db,
         category_id=category_id,
         catalogue_id=catalogue_id,
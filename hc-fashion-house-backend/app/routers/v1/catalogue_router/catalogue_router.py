@@ -72,8 +72,7 @@ def list_active_platforms(
     db: Session = Depends(get_db)
 ):
     """List active platforms (Footwear, Clothing, etc.)"""
-    platforms = PlatformService.list_platforms(db, is_active=True)
-    return [platform_to_dict(p) for p in platforms]
+    return PlatformService.list_platforms(db, is_active=True)
 
 
 @router.get("/platforms/{platform_slug}", response_model=PlatformResponse)
@@ -111,8 +110,7 @@ def list_active_brands(
     db: Session = Depends(get_db)
 ):
     """List active brands"""
-    brands = BrandService.list_brands(db, is_active=True, search=search, skip=skip, limit=limit)
-    return [brand_to_dict(b) for b in brands]
+    return BrandService.list_brands(db, is_active=True, search=search, skip=skip, limit=limit)
 
 
 @router.get("/brands/{brand_slug}", response_model=BrandResponse)
@@ -154,10 +152,10 @@ def get_root_categories(
 @router.get("/categories/{category_id}", response_model=CategoryResponse)
 def get_category(category_id: int, db: Session = Depends(get_db)):
     """Get a category by ID"""
-    category = CategoryService.get_category(db, category_id)
-    if not category.is_active:
+    category = CategoryService.get_category_dict(db, category_id)
+    if not category["is_active"]:
         raise HTTPException(status_code=404, detail="Category not found")
-    return category_to_dict(category)
+    return category
 
 
 @router.get("/categories/slug/{slug}", response_model=CategoryResponse)
@@ -193,10 +191,10 @@ def list_active_catalogues(
 @router.get("/catalogues/{catalogue_id}", response_model=CatalogueResponse)
 def get_catalogue(catalogue_id: int, db: Session = Depends(get_db)):
     """Get a catalogue by ID"""
-    catalogue = CatalogueService.get_catalogue(db, catalogue_id)
-    if not catalogue.is_active:
+    catalogue = CatalogueService.get_catalogue_dict(db, catalogue_id)
+    if not catalogue["is_active"]:
         raise HTTPException(status_code=404, detail="Catalogue not found")
-    return catalogue_to_dict(catalogue)
+    return catalogue
 
 
 @router.get("/catalogues/slug/{slug}", response_model=CatalogueResponse)
@@ -211,8 +209,8 @@ def get_catalogue_by_slug(slug: str, db: Session = Depends(get_db)):
 @router.get("/catalogues/{catalogue_id}/products", response_model=List[ProductResponse])
 def get_catalogue_products(catalogue_id: int, db: Session = Depends(get_db)):
     """Get all LIVE products (color SKUs) in a catalogue"""
-    catalogue = CatalogueService.get_catalogue(db, catalogue_id)
-    if not catalogue.is_active:
+    catalogue = CatalogueService.get_catalogue_dict(db, catalogue_id)
+    if not catalogue["is_active"]:
         raise HTTPException(status_code=404, detail="Catalogue not found")
 
     products = CatalogueService.get_catalogue_products(db, catalogue_id)
@@ -238,6 +236,7 @@ def get_product_listing(
     in_stock_only: bool = Query(False, description="Only show in-stock products"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (replaces page)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -257,7 +256,7 @@ def get_product_listing(
             brand_id = brand_obj.id
     
     skip = (page - 1) * per_page
-    items, total, filters_applied = ProductListingService.get_product_listing(
+    items, total, filters_applied, next_cursor = ProductListingService.get_product_listing(
         db,
         category_id=category_id,
         catalogue_id=catalogue_id,
@@ -270,7 +269,8 @@ def get_product_listing(
         max_price=max_price,
         in_stock_only=in_stock_only,
         skip=skip,
-        limit=per_page
+        limit=per_page,
+        cursor=cursor
     )
 
     return ProductListingResponse(
@@ -278,18 +278,16 @@ def get_product_listing(
         total=total,
         page=page,
         per_page=per_page,
-        pages=(total + per_page - 1) // per_page if total > 0 else 0,
-        filters_applied=filters_applied
+        pages=None if total is None else (total + per_page - 1) // per_page,
+        filters_applied=filters_applied,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/products/slug/{slug}", response_model=ProductResponse)
 def get_product_by_slug(slug: str, db: Session = Depends(get_db)):
     """Get a LIVE product by slug"""
-    product = ProductService.get_product_by_slug(db, slug)
-    if product.status != "live" or product.deleted_at is not None:
-        raise HTTPException(status_code=404, detail="Product not found")
-    return product_to_dict(product)
+    return ProductService.get_live_product_dict_by_slug(db, slug)
 
 
 @router.get("/products/{product_id}", response_model=ProductResponse)
@@ -348,25 +346,23 @@ def get_product_detail_by_slug(
 
     Avoids multiple API calls from frontend.
     """
-    product = ProductService.get_product_by_slug(db, slug)
-    if product.status != "live" or product.deleted_at is not None:
-        raise HTTPException(status_code=404, detail="Product not found")
+    product = ProductService.get_live_product_dict_by_slug(db, slug)
 
     # Get availability
-    availability = AvailabilityService.get_product_availability(db, product.id)
+    availability = AvailabilityService.get_product_availability(db, product["id"])
 
     # Get media grouped
-    all_media = MediaAssetService.list_product_media(db, product.id)
+    all_media = MediaAssetService.list_product_media(db, product["id"])
     grouped = {"catalogue": [], "lifestyle": [], "banner": []}
     for media in all_media:
         if media.usage_type in grouped:
             grouped[media.usage_type].append(media)
 
     # Get color options (other products in same catalogue)
-    color_options = ProductService.get_color_options(db, product.id)
+    color_options = ProductService.get_color_options(db, product["id"])
 
     return ProductDetailResponse(
-        product=product_to_dict(product),
+        product=product,
         availability=ProductAvailabilityResponse(**availability),
         media_grouped=MediaGroupedResponse(**grouped),
         color_options=color_options
@@ -52,8 +52,7 @@ def list_platforms(
     db: Session = Depends(get_db)
 ):
     """List all platforms (Footwear, Clothing, etc.)"""
-    platforms = PlatformService.list_platforms(db, is_active, skip, limit)
-    return [platform_to_dict(p) for p in platforms]
+    return PlatformService.list_platforms(db, is_active, skip, limit)
 
 
 @router.get("/platforms/{platform_id}", response_model=PlatformResponse)
@@ -110,9 +109,8 @@ def list_brands(
     
     # Add product count for each brand
     brands_with_count = []
-    for brand in brands:
-        product_count = db.query(Product).filter(Product.brand_id == brand.id).count()
-        brand_dict = brand_to_dict(brand)
+    for brand_dict in brands:
+        product_count = db.query(Product).filter(Product.brand_id == brand_dict['id']).count()
         brand_dict['product_count'] = product_count
         brands_with_count.append(brand_dict)
     
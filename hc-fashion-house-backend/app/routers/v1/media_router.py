@@ -65,7 +65,7 @@ def handle_exception(e: Exception) -> JSONResponse:
 )
 async def check_r2_health():
     """Check R2 connection status"""
-    result = media_service.check_r2_connection()
+    result = await media_service.check_r2_connection()
     status_code = 200 if result.get("connected", False) else 503
     return JSONResponse(status_code=status_code, content=result)
 
@@ -627,7 +627,7 @@ async def bulk_update_display_order(
 async def delete_media(media_id: int, db: Session = Depends(get_db)):
     """Delete media asset"""
     try:
-        result = media_service.delete_media(db, media_id)
+        result = await media_service.delete_media(db, media_id)
         return MediaDeleteResponse(**result)
     except EcommerceException as e:
         return handle_exception(e)
@@ -661,19 +661,39 @@ async def bulk_upload_product_variant_media(
         "errors": []
     }
 
-    for idx, file in enumerate(files):
-        try:
-            upload_data = ProductVariantMediaUpload(
-                product_id=product_id,
-                variant_id=variant_id,
-                usage_type=usage_type,
-                platform=platform,
-                display_order=idx,
-                is_primary=(idx == 0)  # First image is primary
-            )
+    upload_data_list = [
+        ProductVariantMediaUpload(
+            product_id=product_id,
+            variant_id=variant_id,
+            usage_type=usage_type,
+            platform=platform,
+            display_order=idx,
+            is_primary=(idx == 0)  # First image is primary
+        )
+        for idx in range(len(files))
+    ]
 
-            media = await media_service.upload_product_variant_media(db, file, upload_data)
+    # Uploads run concurrently; one entry per file (MediaAsset or the error)
+    outcomes = await media_service.bulk_upload_product_variant_media(db, files, upload_data_list)
 
+    for idx, (file, media) in enumerate(zip(files, outcomes)):
+        if isinstance(media, EcommerceException):
+            results["failed"] += 1
+            results["errors"].append({
+                "index": idx,
+                "filename": file.filename,
+                "error": media.message,
+                "error_code": media.error_code
+            })
+        elif isinstance(media, Exception):
+            results["failed"] += 1
+            results["errors"].append({
+                "index": idx,
+                "filename": file.filename,
+                "error": str(media),
+                "error_code": "UNKNOWN_ERROR"
+            })
+        else:
             results["successful"] += 1
             results["uploaded"].append(MediaUploadResponse(
                 id=media.id,
@@ -694,23 +714,6 @@ async def bulk_upload_product_variant_media(
                 created_at=media.created_at
             ))
 
-        except EcommerceException as e:
-            results["failed"] += 1
-            results["errors"].append({
-                "index": idx,
-                "filename": file.filename,
-                "error": e.message,
-                "error_code": e.error_code
-            })
-        except Exception as e:
-            results["failed"] += 1
-            results["errors"].append({
-                "index": idx,
-                "filename": file.filename,
-                "error": str(e),
-                "error_code": "UNKNOWN_ERROR"
-            })
-
     return BulkUploadResponse(**results)
 
 
@@ -12,8 +12,8 @@ from models.media_models import (
     MediaType, UsageType, Platform, MediaStatus,
     ProductVariantMediaUpload, CatalogueBannerUpload,
     CategoryBannerUpload, GlobalMediaUpload, MediaUpdateRequest,
-    BulkDisplayOrderUpdate,
-    MediaUploadResponse, MediaDeleteResponse,
+    BulkDisplayOrderUpdate, BulkMediaDelete,
+    MediaUploadResponse, MediaDeleteResponse, BulkMediaDeleteResponse,
     BulkUploadResponse, CloudinaryHealthResponse
 )
 from services.media_upload_service import MediaUploadService
@@ -64,7 +64,7 @@ def handle_exception(e: Exception) -> JSONResponse:
 )
 async def check_cloudinary_health():
     """Check Cloudinary connection status"""
-    result = media_service.check_cloudinary_connection()
+    result = await media_service.check_r2_connection()
     status_code = 200 if result["connected"] else 503
     return JSONResponse(status_code=status_code, content=result)
 
@@ -173,19 +173,39 @@ async def bulk_upload_product_variant_media(
         "errors": []
     }
 
-    for idx, file in enumerate(files):
-        try:
-            upload_data = ProductVariantMediaUpload(
-                product_id=product_id,
-                variant_id=variant_id,
-                usage_type=usage_type,
-                platform=platform,
-                display_order=idx,
-                is_primary=(idx == 0)
-            )
+    upload_data_list = [
+        ProductVariantMediaUpload(
+            product_id=product_id,
+            variant_id=variant_id,
+            usage_type=usage_type,
+            platform=platform,
+            display_order=idx,
+            is_primary=(idx == 0)
+        )
+        for idx in range(len(files))
+    ]
 
-            media = await media_service.upload_product_variant_media(db, file, upload_data)
+    # Uploads run concurrently; one entry per file (MediaAsset or the error)
+    outcomes = await media_service.bulk_upload_product_variant_media(db, files, upload_data_list)
 
+    for idx, (file, media) in enumerate(zip(files, outcomes)):
+        if isinstance(media, EcommerceException):
+            results["failed"] += 1
+            results["errors"].append({
+                "index": idx,
+                "filename": file.filename,
+                "error": media.message,
+                "error_code": media.error_code
+            })
+        elif isinstance(media, Exception):
+            results["failed"] += 1
+            results["errors"].append({
+                "index": idx,
+                "filename": file.filename,
+                "error": str(media),
+                "error_code": "UNKNOWN_ERROR"
+            })
+        else:
             results["successful"] += 1
             results["uploaded"].append(MediaUploadResponse(
                 id=media.id,
@@ -206,23 +226,6 @@ async def bulk_upload_product_variant_media(
                 created_at=media.created_at
             ))
 
-        except EcommerceException as e:
-            results["failed"] += 1
-            results["errors"].append({
-                "index": idx,
-                "filename": file.filename,
-                "error": e.message,
-                "error_code": e.error_code
-            })
-        except Exception as e:
-            results["failed"] += 1
-            results["errors"].append({
-                "index": idx,
-                "filename": file.filename,
-                "error": str(e),
-                "error_code": "UNKNOWN_ERROR"
-            })
-
     return BulkUploadResponse(**results)
 
 
@@ -518,12 +521,30 @@ async def replace_media(
 async def delete_media(media_id: int, db: Session = Depends(get_db)):
     """Delete media asset"""
     try:
-        result = media_service.delete_media(db, media_id)
+        result = await media_service.delete_media(db, media_id)
         return MediaDeleteResponse(**result)
     except EcommerceException as e:
         return handle_exception(e)
 
 
+@router.post(
+    "/bulk/delete",
+    response_model=BulkMediaDeleteResponse,
+    summary="Bulk Delete Media",
+    description="Delete multiple media assets from both R2 and database"
+)
+async def bulk_delete_media(
+    delete_data: BulkMediaDelete,
+    db: Session = Depends(get_db)
+):
+    """Bulk delete media assets"""
+    try:
+        result = await media_service.bulk_delete_media(db, delete_data.media_ids)
+        return BulkMediaDeleteResponse(**result)
+    except EcommerceException as e:
+        return handle_exception(e)
+
+
 # ========================
 # Bulk Display Order Update
 # ========================
@@ -3,7 +3,8 @@ Site Configuration API Router
 Handles website control center endpoints: banners, sections, media library
 """
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, Form, Response
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from datetime import datetime
@@ -457,41 +458,50 @@ async def get_public_section(
 # Placement Key Options
 # ========================
 
+# Static catalogue of placement keys - serialized once at import
+PLACEMENT_KEYS = {
+    "banner_placements": [
+        {"key": "hero_main", "name": "Hero Main Banner", "description": "Main hero banner on homepage"},
+        {"key": "hero_secondary", "name": "Hero Secondary", "description": "Secondary hero slider images"},
+        {"key": "promo_left", "name": "Promo Left", "description": "Left promotional banner"},
+        {"key": "promo_right", "name": "Promo Right", "description": "Right promotional banner"},
+        {"key": "promo_full", "name": "Promo Full Width", "description": "Full-width promotional banner"},
+        {"key": "category_banner", "name": "Category Banner", "description": "Category page header banner"},
+        {"key": "segment_hero", "name": "Segment Hero", "description": "Segment page (Men/Women) hero"},
+        {"key": "footer_banner", "name": "Footer Banner", "description": "Above footer promotional"},
+        {"key": "sale_banner", "name": "Sale Banner", "description": "Sale/Discount announcement"},
+    ],
+    "section_keys": [
+        {"key": "trending", "name": "Trending", "description": "Trending products section"},
+        {"key": "new_arrivals", "name": "New Arrivals", "description": "Newly added products"},
+        {"key": "featured", "name": "Featured", "description": "Featured/Highlighted products"},
+        {"key": "bestsellers", "name": "Bestsellers", "description": "Best selling products"},
+        {"key": "sale", "name": "On Sale", "description": "Products on sale"},
+        {"key": "staff_picks", "name": "Staff Picks", "description": "Staff recommended products"},
+        {"key": "recently_viewed", "name": "Recently Viewed", "description": "User's recently viewed"},
+    ],
+    "page_types": [
+        {"key": "home", "name": "Homepage"},
+        {"key": "segment", "name": "Segment Page (Men/Women)"},
+        {"key": "category", "name": "Category Page"},
+        {"key": "all_products", "name": "All Products Page"},
+    ],
+    "usage_types": [
+        {"key": "banner", "name": "Banner Image"},
+        {"key": "product", "name": "Product Image"},
+        {"key": "lifestyle", "name": "Lifestyle/Promotional"},
+        {"key": "icon", "name": "Icon/Logo"},
+        {"key": "general", "name": "General"},
+    ],
+}
+_PLACEMENT_KEYS_JSON = orjson.dumps(PLACEMENT_KEYS)
+
+
 @router.get("/placement-keys")
 async def get_placement_keys():
     """Get available banner placement keys"""
-    return {
-        "banner_placements": [
-            {"key": "hero_main", "name": "Hero Main Banner", "description": "Main hero banner on homepage"},
-            {"key": "hero_secondary", "name": "Hero Secondary", "description": "Secondary hero slider images"},
-            {"key": "promo_left", "name": "Promo Left", "description": "Left promotional banner"},
-            {"key": "promo_right", "name": "Promo Right", "description": "Right promotional banner"},
-            {"key": "promo_full", "name": "Promo Full Width", "description": "Full-width promotional banner"},
-            {"key": "category_banner", "name": "Category Banner", "description": "Category page header banner"},
-            {"key": "segment_hero", "name": "Segment Hero", "description": "Segment page (Men/Women) hero"},
-            {"key": "footer_banner", "name": "Footer Banner", "description": "Above footer promotional"},
-            {"key": "sale_banner", "name": "Sale Banner", "description": "Sale/Discount announcement"},
-        ],
-        "section_keys": [
-            {"key": "trending", "name": "Trending", "description": "Trending products section"},
-            {"key": "new_arrivals", "name": "New Arrivals", "description": "Newly added products"},
-            {"key": "featured", "name": "Featured", "description": "Featured/Highlighted products"},
-            {"key": "bestsellers", "name": "Bestsellers", "description": "Best selling products"},
-            {"key": "sale", "name": "On Sale", "description": "Products on sale"},
-            {"key": "staff_picks", "name": "Staff Picks", "description": "Staff recommended products"},
-            {"key": "recently_viewed", "name": "Recently Viewed", "description": "User's recently viewed"},
-        ],
-        "page_types": [
-            {"key": "home", "name": "Homepage"},
-            {"key": "segment", "name": "Segment Page (Men/Women)"},
-            {"key": "category", "name": "Category Page"},
-            {"key": "all_products", "name": "All Products Page"},
-        ],
-        "usage_types": [
-            {"key": "banner", "name": "Banner Image"},
-            {"key": "product", "name": "Product Image"},
-            {"key": "lifestyle", "name": "Lifestyle/Promotional"},
-            {"key": "icon", "name": "Icon/Logo"},
-            {"key": "general", "name": "General"},
-        ],
-    }
+    return Response(
+        content=_PLACEMENT_KEYS_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600, immutable"}
+    )
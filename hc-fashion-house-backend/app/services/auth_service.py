@@ -3,8 +3,14 @@ Auth Service - Supabase Postgres Version
 Handles user management via Supabase Postgres (NOT SQLite)
 NO passwords stored - Supabase handles all auth
 """
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Optional, List, Dict, Any, Tuple
+
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 
 from models.auth_models import (
@@ -13,9 +19,65 @@ from models.auth_models import (
     UserPreferencesUpdate, CurrentUser
 )
 from utils.supabase_config import (
-    get_supabase_client, get_supabase_admin_client, verify_jwt_token
+    get_supabase_client, get_supabase_admin_client, verify_jwt_token,
+    decode_jwt_payload
 )
 
+logger = logging.getLogger(__name__)
+
+
+# ========================
+# Authenticated User Cache
+# ========================
+# Avoids re-validating the JWT and re-querying Supabase on every request.
+# Entries live for at most USER_CACHE_TTL_SECONDS (or until the token expires)
+# and are dropped explicitly when a user's status, profile or roles change.
+
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_SIZE = 10000
+
+_user_cache: TTLCache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Hash the token so raw JWTs are never kept in memory as cache keys"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _get_cached_user(token: str) -> Optional[CurrentUser]:
+    """Return the cached user for a token, if present and not expired"""
+    key = _token_cache_key(token)
+    with _user_cache_lock:
+        entry: Optional[Tuple[float, CurrentUser]] = _user_cache.get(key)
+        if entry is None:
+            return None
+        valid_until, user = entry
+        if time.time() >= valid_until:
+            _user_cache.pop(key, None)
+            return None
+        return user
+
+
+def _cache_user(token: str, user: CurrentUser) -> None:
+    """Cache a validated user, never beyond the token's own expiry"""
+    valid_until = time.time() + USER_CACHE_TTL_SECONDS
+    claims = decode_jwt_payload(token) or {}
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        valid_until = min(valid_until, exp)
+
+    with _user_cache_lock:
+        _user_cache[_token_cache_key(token)] = (valid_until, user)
+
+
+def invalidate_user_cache(user_id: str) -> None:
+    """Drop every cached token entry belonging to a user"""
+    with _user_cache_lock:
+        stale_keys = [key for key, (_, user) in _user_cache.items() if user.user_id == user_id]
+        for key in stale_keys:
+            _user_cache.pop(key, None)
+
 
 class AuthService:
     """
@@ -24,12 +86,17 @@ class AuthService:
     """
 
     @staticmethod
-    def get_current_user_from_token(token: str) -> CurrentUser:
+    async def get_current_user_from_token(token: str) -> CurrentUser:
         """
         Validate JWT token and get current user context.
         Auto-creates user profile if first login (via Supabase trigger).
+        Profile and roles are fetched concurrently; the result is cached briefly.
         """
-        user_info = verify_jwt_token(token)
+        cached_user = _get_cached_user(token)
+        if cached_user is not None:
+            return cached_user
+
+        user_info = await asyncio.to_thread(verify_jwt_token, token)
 
         if not user_info:
             raise HTTPException(
@@ -43,16 +110,24 @@ class AuthService:
         # Get user profile from Supabase
         client = get_supabase_admin_client()
 
-        # Fetch user profile
-        result = client.table("user_profile").select("*").eq("id", user_id).execute()
+        # Fetch user profile and roles in parallel (the Supabase client is sync,
+        # so each query runs in a worker thread)
+        profile_result, roles_result = await asyncio.gather(
+            asyncio.to_thread(
+                lambda: client.table("user_profile").select("*").eq("id", user_id).execute()
+            ),
+            asyncio.to_thread(
+                lambda: client.table("user_roles").select("role_id, roles(role_name)").eq("user_id", user_id).execute()
+            )
+        )
 
-        if not result.data or len(result.data) == 0:
+        if not profile_result.data or len(profile_result.data) == 0:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User profile not found. Please try logging in again."
             )
 
-        user_profile = result.data[0]
+        user_profile = profile_result.data[0]
 
         if user_profile.get("status") != UserStatus.ACTIVE.value:
             raise HTTPException(
@@ -60,10 +135,9 @@ class AuthService:
                 detail=f"User account is {user_profile.get('status')}"
             )
 
-        # Get user roles
-        roles = UserService.get_user_roles(user_id)
+        roles = UserService._extract_role_names(roles_result.data)
 
-        return CurrentUser(
+        current_user = CurrentUser(
             user_id=user_id,
             phone=user_profile.get("phone"),
             email=user_profile.get("email"),
@@ -72,6 +146,9 @@ class AuthService:
             status=UserStatus(user_profile.get("status", "ACTIVE"))
         )
 
+        _cache_user(token, current_user)
+        return current_user
+
 
 class UserService:
     """Service for user profile operations via Supabase Postgres"""
@@ -106,8 +183,7 @@ class UserService:
         if "dob" in update_dict and update_dict["dob"]:
             update_dict["dob"] = str(update_dict["dob"])
 
-        update_dict["updated_at"] = datetime.utcnow().isoformat()
-
+        # updated_at is maintained by the update_user_profile_updated_at trigger
         result = client.table("user_profile").update(update_dict).eq("id", user_id).execute()
 
         if not result.data or len(result.data) == 0:
@@ -116,6 +192,7 @@ class UserService:
                 detail="User not found"
             )
 
+        invalidate_user_cache(user_id)
         return result.data[0]
 
     @staticmethod
@@ -126,10 +203,11 @@ class UserService:
         result = client.table("user_preferences").select("*").eq("user_id", user_id).execute()
 
         if not result.data or len(result.data) == 0:
-            # Create default preferences
+            # Create default preferences (upsert so a concurrent first request
+            # returns the existing row instead of failing on the primary key)
             new_prefs = {"user_id": user_id}
-            insert_result = client.table("user_preferences").insert(new_prefs).execute()
-            return insert_result.data[0] if insert_result.data else new_prefs
+            upsert_result = client.table("user_preferences").upsert(new_prefs, on_conflict="user_id").execute()
+            return upsert_result.data[0] if upsert_result.data else new_prefs
 
         return result.data[0]
 
@@ -147,12 +225,9 @@ class UserService:
         if not update_dict:
             return UserService.get_user_preferences(user_id)
 
-        result = client.table("user_preferences").update(update_dict).eq("user_id", user_id).execute()
-
-        if not result.data or len(result.data) == 0:
-            # Try insert if update failed (record doesn't exist)
-            update_dict["user_id"] = user_id
-            result = client.table("user_preferences").insert(update_dict).execute()
+        # Single atomic INSERT ... ON CONFLICT (user_id) DO UPDATE
+        update_dict["user_id"] = user_id
+        result = client.table("user_preferences").upsert(update_dict, on_conflict="user_id").execute()
 
         return result.data[0] if result.data else update_dict
 
@@ -164,9 +239,14 @@ class UserService:
         # Join user_roles with roles to get role names
         result = client.table("user_roles").select("role_id, roles(role_name)").eq("user_id", user_id).execute()
 
+        return UserService._extract_role_names(result.data)
+
+    @staticmethod
+    def _extract_role_names(rows: Optional[List[Dict[str, Any]]]) -> List[str]:
+        """Extract role names from user_roles rows joined with roles"""
         roles = []
-        if result.data:
-            for ur in result.data:
+        if rows:
+            for ur in rows:
                 if ur.get("roles") and ur["roles"].get("role_name"):
                     roles.append(ur["roles"]["role_name"])
 
@@ -177,26 +257,27 @@ class UserService:
         """Assign a role to user in Supabase"""
         client = get_supabase_admin_client()
 
-        # Get role_id
-        role_result = client.table("roles").select("role_id").eq("role_name", role_name.upper()).execute()
+        # Get role_id (from the in-memory roles table)
+        role_id = RoleService.get_role_id(role_name)
 
-        if not role_result.data or len(role_result.data) == 0:
+        if role_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Role '{role_name}' not found"
             )
 
-        role_id = role_result.data[0]["role_id"]
+        # Assign role - duplicates are ignored via the (user_id, role_id) primary key,
+        # so only a newly inserted row comes back
+        result = client.table("user_roles").upsert(
+            {"user_id": user_id, "role_id": role_id},
+            on_conflict="user_id,role_id",
+            ignore_duplicates=True
+        ).execute()
 
-        # Check if already assigned
-        existing = client.table("user_roles").select("*").eq("user_id", user_id).eq("role_id", role_id).execute()
-
-        if existing.data and len(existing.data) > 0:
+        if not result.data:
             return False  # Already has role
 
-        # Assign role
-        client.table("user_roles").insert({"user_id": user_id, "role_id": role_id}).execute()
-
+        invalidate_user_cache(user_id)
         return True
 
     @staticmethod
@@ -204,20 +285,19 @@ class UserService:
         """Remove a role from user in Supabase"""
         client = get_supabase_admin_client()
 
-        # Get role_id
-        role_result = client.table("roles").select("role_id").eq("role_name", role_name.upper()).execute()
+        # Get role_id (from the in-memory roles table)
+        role_id = RoleService.get_role_id(role_name)
 
-        if not role_result.data or len(role_result.data) == 0:
+        if role_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Role '{role_name}' not found"
             )
 
-        role_id = role_result.data[0]["role_id"]
-
         # Delete role assignment
         result = client.table("user_roles").delete().eq("user_id", user_id).eq("role_id", role_id).execute()
 
+        invalidate_user_cache(user_id)
         return len(result.data) > 0 if result.data else False
 
     @staticmethod
@@ -226,8 +306,7 @@ class UserService:
         client = get_supabase_admin_client()
 
         result = client.table("user_profile").update({
-            "status": UserStatus.BLOCKED.value,
-            "updated_at": datetime.utcnow().isoformat()
+            "status": UserStatus.BLOCKED.value
         }).eq("id", user_id).execute()
 
         if not result.data or len(result.data) == 0:
@@ -236,6 +315,7 @@ class UserService:
                 detail="User not found"
             )
 
+        invalidate_user_cache(user_id)
         return result.data[0]
 
     @staticmethod
@@ -244,8 +324,7 @@ class UserService:
         client = get_supabase_admin_client()
 
         result = client.table("user_profile").update({
-            "status": UserStatus.ACTIVE.value,
-            "updated_at": datetime.utcnow().isoformat()
+            "status": UserStatus.ACTIVE.value
         }).eq("id", user_id).execute()
 
         if not result.data or len(result.data) == 0:
@@ -254,12 +333,97 @@ class UserService:
                 detail="User not found"
             )
 
+        invalidate_user_cache(user_id)
         return result.data[0]
 
 
+# ========================
+# Background Audit Writer
+# ========================
+# Audit entries are queued from the request path and written to Supabase in
+# batches by a single background task, so logging never adds a round-trip
+# to the response. Started/stopped from the application lifespan.
+
+AUDIT_QUEUE_MAX_SIZE = 10000
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.5
+
+_audit_queue: Optional[asyncio.Queue] = None
+_audit_writer_task: Optional[asyncio.Task] = None
+
+
+def _insert_audit_logs(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Insert one or more audit log rows in a single request"""
+    client = get_supabase_admin_client()
+    result = client.table("user_audit_log").insert(entries).execute()
+    return result.data or []
+
+
+async def _flush_audit_batch(batch: List[Dict[str, Any]]) -> None:
+    """Write a batch of audit entries, logging (not raising) on failure"""
+    try:
+        await asyncio.to_thread(_insert_audit_logs, batch)
+    except Exception as e:
+        logger.error("Failed to write %s audit log entries: %s", len(batch), e)
+
+
+async def _audit_writer(queue: asyncio.Queue) -> None:
+    """Drain the audit queue, flushing every AUDIT_BATCH_SIZE entries or AUDIT_FLUSH_INTERVAL_SECONDS"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + AUDIT_FLUSH_INTERVAL_SECONDS
+
+        try:
+            while len(batch) < AUDIT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+        except asyncio.CancelledError:
+            # Shutting down - don't lose the batch being collected
+            await _flush_audit_batch(batch)
+            raise
+
+        await _flush_audit_batch(batch)
+
+
 class AuditService:
     """Service for audit logging in Supabase"""
 
+    @staticmethod
+    def start_writer() -> None:
+        """Start the background audit writer on the running event loop"""
+        global _audit_queue, _audit_writer_task
+        if _audit_writer_task is not None and not _audit_writer_task.done():
+            return
+        _audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAX_SIZE)
+        _audit_writer_task = asyncio.create_task(_audit_writer(_audit_queue))
+
+    @staticmethod
+    async def stop_writer() -> None:
+        """Stop the background audit writer and flush anything still queued"""
+        global _audit_queue, _audit_writer_task
+        task, queue = _audit_writer_task, _audit_queue
+        _audit_writer_task, _audit_queue = None, None
+
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        if queue is not None:
+            pending = []
+            while not queue.empty():
+                pending.append(queue.get_nowait())
+            for i in range(0, len(pending), AUDIT_BATCH_SIZE):
+                await _flush_audit_batch(pending[i:i + AUDIT_BATCH_SIZE])
+
     @staticmethod
     def log_action(
         user_id: str,
@@ -268,9 +432,13 @@ class AuditService:
         user_agent: Optional[str] = None,
         details: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Log a user action to Supabase"""
-        client = get_supabase_admin_client()
+        """
+        Log a user action to Supabase.
 
+        Queued for the background writer when called on the event loop;
+        written directly when the writer isn't running (scripts, worker
+        threads) or the queue is full, so entries are never dropped.
+        """
         log_entry = {
             "user_id": user_id,
             "action": action.value if isinstance(action, AuditAction) else action,
@@ -279,34 +447,60 @@ class AuditService:
             "details": details
         }
 
-        result = client.table("user_audit_log").insert(log_entry).execute()
+        queue = _audit_queue
+        if queue is not None and _audit_writer_task is not None and not _audit_writer_task.done():
+            try:
+                asyncio.get_running_loop()
+                queue.put_nowait(log_entry)
+                return log_entry
+            except (RuntimeError, asyncio.QueueFull):
+                pass
 
-        return result.data[0] if result.data else log_entry
+        result = _insert_audit_logs([log_entry])
+        return result[0] if result else log_entry
 
     @staticmethod
     def get_user_audit_logs(user_id: str, skip: int = 0, limit: int = 50) -> tuple:
         """Get audit logs for a user from Supabase"""
         client = get_supabase_admin_client()
 
-        # Get total count
-        count_result = client.table("user_audit_log").select("audit_id", count="exact").eq("user_id", user_id).execute()
-        total = count_result.count if count_result.count else 0
+        # Get paginated logs and the exact total in a single request
+        result = client.table("user_audit_log").select("*", count="exact").eq("user_id", user_id).order("created_at", desc=True).range(skip, skip + limit - 1).execute()
+
+        return result.data or [], result.count or 0
 
-        # Get paginated logs
-        result = client.table("user_audit_log").select("*").eq("user_id", user_id).order("created_at", desc=True).range(skip, skip + limit - 1).execute()
 
-        return result.data or [], total
+# Roles are a tiny, seeded table - keep them in memory for a short TTL
+ROLES_CACHE_TTL_SECONDS = 60
+
+_roles_cache: TTLCache = TTLCache(maxsize=1, ttl=ROLES_CACHE_TTL_SECONDS)
 
 
 class RoleService:
     """Service for role management in Supabase"""
 
     @staticmethod
-    def get_all_roles() -> List[Dict[str, Any]]:
-        """Get all roles from Supabase"""
-        client = get_supabase_admin_client()
+    def get_all_roles(refresh: bool = False) -> List[Dict[str, Any]]:
+        """Get all roles (served from memory for ROLES_CACHE_TTL_SECONDS)"""
+        roles = None if refresh else _roles_cache.get("roles")
+
+        if roles is None:
+            client = get_supabase_admin_client()
+            result = client.table("roles").select("*").execute()
+            roles = result.data or []
+            _roles_cache["roles"] = roles
+
+        return list(roles)
+
+    @staticmethod
+    def get_role_id(role_name: str) -> Optional[int]:
+        """Resolve a role name to its role_id, reloading roles once on a miss"""
+        role_name = role_name.upper()
 
-        result = client.table("roles").select("*").execute()
+        for refresh in (False, True):
+            for role in RoleService.get_all_roles(refresh=refresh):
+                if role.get("role_name") == role_name:
+                    return role["role_id"]
 
-        return result.data or []
+        return None
 
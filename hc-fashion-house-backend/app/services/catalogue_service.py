@@ -3,14 +3,30 @@ Catalogue Service - Business logic for catalogue operations
 Updated for new schema:
 - Platform → Category → Catalogue (with gender) → Product (Color SKU) → Variant → Option
 """
+import base64
+import copy
+import json
+import logging
+import threading
+from functools import lru_cache
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
+
+from cachetools import TTLCache
+from sqlalchemy import and_, delete, exists, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload, undefer
 from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+from configs.settings import settings
 
 from database.db_models import (
     Platform, Brand, Category, Catalogue, Product,
-    ProductVariant, VariantOption, MediaAsset, FootwearDetails
+    ProductVariant, VariantOption, MediaAsset, FootwearDetails,
+    ProductTag, product_categories
 )
 from models.catalogue_models import (
     PlatformCreate, PlatformUpdate,
@@ -29,10 +45,17 @@ from models.catalogue_models import (
 
 import re
 
+logger = logging.getLogger(__name__)
+
 # ========================
 # Color Normalization Helper
 # ========================
 
+_COLOR_SEP_RE = re.compile(r'[\s/\\|,]+')
+_DASH_RUN_RE = re.compile(r'-+')
+
+
+@lru_cache(maxsize=256)
 def normalize_color(color: str) -> str:
     """
     Normalize color string for filtering.
@@ -42,14 +65,38 @@ def normalize_color(color: str) -> str:
     if not color:
         return None
     # Replace common separators with hyphen
-    normalized = re.sub(r'[\s/\\|,]+', '-', color.strip())
+    normalized = _COLOR_SEP_RE.sub('-', color.strip())
     # Remove consecutive hyphens
-    normalized = re.sub(r'-+', '-', normalized)
+    normalized = _DASH_RUN_RE.sub('-', normalized)
     # Lowercase and strip leading/trailing hyphens
     normalized = normalized.lower().strip('-')
     return normalized
 
 
+def _pack_tags(tags: List[str]) -> tuple:
+    """(comma-separated tags or None, whether 'featured' is a tag) for storage"""
+    return (','.join(tags) if tags else None), "featured" in tags
+
+
+@lru_cache(maxsize=1024)
+def _parse_tags(tags: str) -> tuple:
+    """
+    Parse a stored tag string (same rules as Product.get_tags_list).
+    Memoized: the same few tag combinations repeat across most products.
+    """
+    return tuple(tag.strip().lower() for tag in tags.split(',') if tag.strip())
+
+
+def _product_tags_list(product: Product) -> List[str]:
+    """Product tags as a fresh list, parsed once per distinct tag string"""
+    return list(_parse_tags(product.tags)) if product.tags else []
+
+
+def _tag_rows(product_id: int, tags: List[str]) -> List[dict]:
+    """product_tags rows for a product's (already normalized) tag list"""
+    return [{"product_id": product_id, "tag": tag} for tag in tags]
+
+
 # ========================
 # Helper Functions to Convert SQLAlchemy to Dict
 # ========================
@@ -110,44 +157,26 @@ def catalogue_to_dict(catalogue: Catalogue) -> dict:
 
 
 def product_to_dict(product: Product) -> dict:
-    """Convert SQLAlchemy Product model to dictionary for Pydantic serialization"""
-    # Get gender from catalogue relationship
-    gender = None
-    platform_slug = None
-    catalogue_name = None
-    if product.catalogue:
-        gender = product.catalogue.gender
-        catalogue_name = product.catalogue.name
-        if product.catalogue.category and product.catalogue.category.platform:
-            platform_slug = product.catalogue.category.platform.slug
-    
-    # Get media assets
-    media = []
-    if hasattr(product, 'media_assets') and product.media_assets:
-        for m in product.media_assets:
-            media.append({
-                "id": m.id,
-                "media_url": m.cloudinary_url,  # Use cloudinary_url from model
-                "media_type": m.media_type,
-                "is_primary": m.is_primary,
-                "display_order": m.display_order,
-                "usage_type": m.usage_type,
-            })
-    
-    # Get category IDs and full category objects for display
-    category_ids = [cat.id for cat in product.categories] if product.categories else []
-    categories_list = [{"id": cat.id, "name": cat.name, "slug": cat.slug} for cat in product.categories] if product.categories else []
-    
+    """
+    Convert SQLAlchemy Product model to dictionary for Pydantic serialization.
+    Expects relationships to be loaded up front (see PRODUCT_EAGER).
+    """
+    catalogue = product.catalogue
+    category = catalogue.category if catalogue else None
+    platform = category.platform if category else None
+    gender = catalogue.gender if catalogue else None
+    categories = product.categories
+
     return {
         "id": product.id,
         "name": product.name,
         "slug": product.slug,
         "catalogue_id": product.catalogue_id,
-        "catalogue_name": catalogue_name,  # Add catalogue name for display
+        "catalogue_name": catalogue.name if catalogue else None,  # For display
         "brand_id": product.brand_id,
         "brand": brand_to_dict(product.brand) if product.brand else None,
-        "category_ids": category_ids,  # Multiple categories (IDs only)
-        "categories": categories_list,  # Full category objects with id, name, slug
+        "category_ids": [cat.id for cat in categories],  # Multiple categories (IDs only)
+        "categories": [{"id": cat.id, "name": cat.name, "slug": cat.slug} for cat in categories],
         "color": product.color,
         "color_hex": product.color_hex,
         "color_normalized": product.color_normalized,
@@ -156,27 +185,36 @@ def product_to_dict(product: Product) -> dict:
         "short_description": product.short_description,
         "long_description": product.long_description,
         "specifications": product.specifications,
-        "is_featured": product.is_featured or False,
-        "tags": product.get_tags_list() if hasattr(product, 'get_tags_list') else [],
+        "is_featured": bool(product.is_featured),
+        "tags": _product_tags_list(product),
         "status": ProductStatus(product.status) if product.status else ProductStatus.DRAFT,
         "meta_title": product.meta_title,
         "meta_description": product.meta_description,
-        "is_active": True,  # Not in DB yet, default to True
         "created_at": product.created_at,
         "updated_at": product.updated_at,
-        "variants": [variant_to_dict(v) for v in (product.variants or [])],
-        "media": media,  # Add media for images
-        "footwear_details": footwear_to_dict(product.footwear_details) if product.footwear_details else None,
+        "variants": [variant_to_dict(v) for v in product.variants],
+        "media": [
+            {
+                "id": m.id,
+                "media_url": m.cloudinary_url,  # Use cloudinary_url from model
+                "media_type": m.media_type,
+                "is_primary": m.is_primary,
+                "display_order": m.display_order,
+                "usage_type": m.usage_type,
+            }
+            for m in product.media_assets
+        ],
+        "footwear_details": footwear_to_dict(product.footwear_details),
         # Inherited from catalogue
         "gender": Gender(gender) if gender else None,
-        "platform_slug": platform_slug,
+        "platform_slug": platform.slug if platform else None,
     }
 
 
 def variant_to_dict(variant: ProductVariant) -> dict:
     """Convert SQLAlchemy ProductVariant model to dictionary"""
-    # Calculate total stock from options
-    total_stock = sum(opt.stock_quantity or 0 for opt in (variant.options or []))
+    # Summed in SQL (ProductVariant.total_stock)
+    total_stock = variant.total_stock
     # Get size from variant_name or from options
     size = variant.variant_name
     if not size and variant.options:
@@ -226,6 +264,310 @@ def footwear_to_dict(footwear: FootwearDetails) -> dict:
     }
 
 
+# Loader options for everything product_to_dict touches. To-one chains are
+# joined; collections use selectinload to avoid a Cartesian row blow-up.
+PRODUCT_EAGER = (
+    joinedload(Product.catalogue).joinedload(Catalogue.category).joinedload(Category.platform),
+    joinedload(Product.brand),
+    joinedload(Product.footwear_details),
+    selectinload(Product.categories),
+    selectinload(Product.media_assets),
+    selectinload(Product.variants).options(
+        selectinload(ProductVariant.options), undefer(ProductVariant.total_stock)
+    ),
+)
+
+# Same graph for paginated lists, where the filter JOINs on Catalogue/Category/
+# Platform would otherwise be duplicated by joined eager loads. Each level is
+# one extra IN query per page instead of wider rows.
+PRODUCT_LIST_EAGER = (
+    selectinload(Product.catalogue).selectinload(Catalogue.category).selectinload(Category.platform),
+    selectinload(Product.brand),
+    selectinload(Product.footwear_details),
+    selectinload(Product.categories),
+    selectinload(Product.media_assets),
+    selectinload(Product.variants).options(
+        selectinload(ProductVariant.options), undefer(ProductVariant.total_stock)
+    ),
+)
+
+# With DEBUG_ORM on, any relationship not covered by the explicit loader
+# options raises instead of lazy loading one row at a time. The raise sticks
+# to the loaded objects, so the read-only queries using it detach what they
+# loaded (_release_strict_loads) before the session is reused, e.g. for writes.
+STRICT_LOADING = (raiseload('*'),) if settings.DEBUG_ORM else ()
+
+
+def _release_strict_loads(db: Session, objs) -> None:
+    """Detach objects loaded under STRICT_LOADING (no-op when it's off)"""
+    if not STRICT_LOADING:
+        return
+    for obj in objs:
+        if obj is not None and obj in db:
+            db.expunge(obj)
+
+
+# ========================
+# Lookup Table Cache
+# ========================
+# Platforms and brands change rarely but are read on nearly every catalogue
+# page. List results are cached as plain dicts (never ORM instances) for a
+# short TTL and dropped whenever the matching create/update/delete runs.
+
+LOOKUP_CACHE_TTL_SECONDS = 60
+
+_lookup_cache: TTLCache = TTLCache(maxsize=512, ttl=LOOKUP_CACHE_TTL_SECONDS)
+_lookup_cache_lock = threading.Lock()
+
+
+def _get_cached_lookup(key: tuple) -> Optional[List[dict]]:
+    """Return a copy of a cached lookup list, or None on a miss"""
+    with _lookup_cache_lock:
+        rows = _lookup_cache.get(key)
+    return [dict(row) for row in rows] if rows is not None else None
+
+
+def _cache_lookup(key: tuple, rows: List[dict]) -> List[dict]:
+    """Cache a lookup list and return a copy for the caller"""
+    with _lookup_cache_lock:
+        _lookup_cache[key] = rows
+    return [dict(row) for row in rows]
+
+
+def invalidate_lookup_cache(table: str) -> None:
+    """Drop every cached lookup list for a table ("platforms" or "brands")"""
+    with _lookup_cache_lock:
+        for key in [k for k in _lookup_cache.keys() if k[0] == table]:
+            _lookup_cache.pop(key, None)
+    # Listing items embed brand names and platform slugs
+    invalidate_listing_cache()
+
+
+# ========================
+# Update Payload Helper
+# ========================
+
+def _set_fields(data: BaseModel) -> dict:
+    """
+    Fields explicitly set on an update payload, like
+    model_dump(exclude_unset=True) but touching only those fields.
+    Nested models are dumped the same way.
+    """
+    values = {}
+    for name in data.model_fields_set:
+        value = getattr(data, name)
+        if isinstance(value, BaseModel):
+            value = value.model_dump(exclude_unset=True)
+        values[name] = value
+    return values
+
+
+# ========================
+# Entity Read Cache
+# ========================
+# Storefront pages re-read the same category, catalogue and product on every
+# render. Their serialized dicts are cached for a short TTL. Product dicts
+# embed brand/catalogue/category/platform fields, so every invalidation also
+# drops all cached products.
+
+ENTITY_CACHE_TTL_SECONDS = 30
+
+_entity_cache: TTLCache = TTLCache(maxsize=2048, ttl=ENTITY_CACHE_TTL_SECONDS)
+_entity_cache_lock = threading.Lock()
+
+
+def _get_cached_entity(key: tuple) -> Optional[dict]:
+    """Return a deep copy of a cached entity dict, or None on a miss"""
+    with _entity_cache_lock:
+        row = _entity_cache.get(key)
+    # Deep: product dicts nest variants, media and details
+    return copy.deepcopy(row) if row is not None else None
+
+
+def _cache_entity(key: tuple, row: dict) -> dict:
+    """Cache an entity dict and return a deep copy for the caller"""
+    with _entity_cache_lock:
+        _entity_cache[key] = row
+    return copy.deepcopy(row)
+
+
+def invalidate_entity_cache(kind: str, entity_id: Optional[int] = None) -> None:
+    """
+    Drop a cached entity ("category"/"catalogue" by id) together with every
+    cached product. Use kind="product" to drop only the products.
+    """
+    with _entity_cache_lock:
+        _entity_cache.pop((kind, entity_id), None)
+        for key in [k for k in _entity_cache.keys() if k[0] == "product"]:
+            _entity_cache.pop(key, None)
+    invalidate_listing_cache()
+
+
+# ========================
+# Product Listing Cache
+# ========================
+# The storefront listing is deterministic in its filters and the same filter
+# combinations repeat heavily. Whole results are cached for a short TTL and
+# dropped on any catalogue write (entity or lookup invalidation).
+
+LISTING_CACHE_TTL_SECONDS = 60
+
+_listing_cache: TTLCache = TTLCache(maxsize=256, ttl=LISTING_CACHE_TTL_SECONDS)
+_listing_cache_lock = threading.Lock()
+
+
+def _get_cached_listing(key: tuple) -> Optional[tuple]:
+    """Return a deep copy of a cached (items, total, filters_applied, next_cursor), or None on a miss"""
+    with _listing_cache_lock:
+        result = _listing_cache.get(key)
+    # Deep: items carry nested lists/dicts (tags, sizes, colors)
+    return copy.deepcopy(result) if result is not None else None
+
+
+def _cache_listing(key: tuple, result: tuple) -> tuple:
+    """Cache a listing result and return a deep copy for the caller"""
+    with _listing_cache_lock:
+        _listing_cache[key] = result
+    return copy.deepcopy(result)
+
+
+# ========================
+# Listing Keyset Cursor
+# ========================
+# Opaque cursor over the listing sort key (is_featured, created_at, id), so
+# the next page seeks past the last row instead of OFFSET-scanning.
+
+def _encode_listing_cursor(product: Product) -> str:
+    """Cursor for the page after this product"""
+    key = [bool(product.is_featured), product.created_at.isoformat(), product.id]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_listing_cursor(cursor: str) -> tuple:
+    """(is_featured, created_at, id) from a listing cursor; 400 if malformed"""
+    try:
+        is_featured, created_at, product_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return bool(is_featured), datetime.fromisoformat(created_at), int(product_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid listing cursor"
+        )
+
+
+def invalidate_listing_cache() -> None:
+    """Drop every cached product listing"""
+    with _listing_cache_lock:
+        _listing_cache.clear()
+
+
+# ========================
+# Write Helpers
+# ========================
+
+def commit_detached(db: Session, *objs) -> None:
+    """Flush, detach and commit, so the commit doesn't expire the rows (no refresh SELECT)"""
+    db.flush()
+    for obj in objs:
+        db.expunge(obj)
+    db.commit()
+
+
+# ========================
+# Primary Image Denormalization
+# ========================
+# Product.primary_image_url mirrors the product's primary media so listings
+# read it straight off the product row. Every write that can change which
+# media is primary (or its URL) calls this before committing.
+
+def sync_primary_image(db: Session, product_id: Optional[int]) -> None:
+    """Recompute Product.primary_image_url from its media (lowest id wins)"""
+    if not product_id:
+        return
+    db.flush()
+    db.execute(
+        update(Product)
+        .where(Product.id == product_id)
+        .values(primary_image_url=(
+            select(MediaAsset.cloudinary_url)
+            .where(
+                MediaAsset.product_id == product_id,
+                MediaAsset.is_primary == True,
+                MediaAsset.deleted_at.is_(None)
+            )
+            .order_by(MediaAsset.id)
+            .limit(1)
+            .scalar_subquery()
+        ))
+        .execution_options(synchronize_session=False)
+    )
+
+
+# ========================
+# Slug-Unique Insert
+# ========================
+
+def _insert_unless_slug_taken(db: Session, model, values: dict):
+    """
+    INSERT ... ON CONFLICT (slug) DO NOTHING RETURNING the new row.
+    Returns None when the slug is already taken, so the duplicate check and
+    the insert are one atomic statement.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        stmt = sqlite_insert(model).on_conflict_do_nothing(index_elements=[model.slug])
+    elif dialect == "postgresql":
+        stmt = pg_insert(model).on_conflict_do_nothing(index_elements=[model.slug])
+    else:
+        stmt = insert(model)
+    return db.execute(stmt.values(**values).returning(model)).scalar_one_or_none()
+
+
+# ========================
+# Core Update Helper
+# ========================
+
+def _update_returning(db: Session, model, entity_id: int, values: dict):
+    """
+    UPDATE one row by id with a Core statement and RETURNING the ORM instance,
+    so the row isn't loaded and diffed first. With nothing to set it is a
+    plain lookup. Returns None when no row matches.
+    """
+    if not values:
+        return db.get(model, entity_id)
+    return db.scalars(
+        update(model)
+        .where(model.id == entity_id)
+        .values(**values)
+        .returning(model)
+        .execution_options(synchronize_session=False, populate_existing=True)
+    ).first()
+
+
+# ========================
+# Session Existence Cache
+# ========================
+# Foreign-key validation repeats the same "does id N exist" probe many times
+# within one request (e.g. a bulk upload re-checking one brand per row). Hits
+# are remembered on the session itself, so they never outlive the request.
+
+def _exists_cached(db: Session, model, obj_id: int) -> bool:
+    """Return True if a row with this id exists, caching hits per session"""
+    cache = db.info.setdefault("existence_cache", {})
+    key = (model.__tablename__, obj_id)
+    if key in cache:
+        return True
+    found = db.query(exists().where(model.id == obj_id)).scalar()
+    if found:
+        cache[key] = True
+    return found
+
+
+def _forget_exists(db: Session, model, obj_id: int) -> None:
+    """Drop a cached existence hit after the row is deleted"""
+    db.info.get("existence_cache", {}).pop((model.__tablename__, obj_id), None)
+
+
 # ========================
 # Platform Service
 # ========================
@@ -238,21 +580,25 @@ class PlatformService:
         """Create a new platform"""
         slug = platform_data.slug or generate_slug(platform_data.name)
 
-        existing = db.query(Platform).filter(Platform.slug == slug).first()
-        if existing:
+        slug_taken = db.execute(select(exists().where(Platform.slug == slug))).scalar()
+        if slug_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Platform with slug '{slug}' already exists"
             )
 
-        platform = Platform(
-            name=platform_data.name,
-            slug=slug,
-            is_active=platform_data.is_active
-        )
-        db.add(platform)
-        db.commit()
-        db.refresh(platform)
+        # INSERT ... RETURNING gives back id/created_at without a refresh SELECT
+        platform = db.execute(
+            insert(Platform)
+            .values(
+                name=platform_data.name,
+                slug=slug,
+                is_active=platform_data.is_active
+            )
+            .returning(Platform)
+        ).scalar_one()
+        commit_detached(db, platform)
+        invalidate_lookup_cache("platforms")
         return platform
 
     @staticmethod
@@ -283,28 +629,34 @@ class PlatformService:
         is_active: Optional[bool] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Platform]:
-        """List platforms with optional filters"""
+    ) -> List[dict]:
+        """List platforms with optional filters (cached, returned as dicts)"""
+        cache_key = ("platforms", is_active, skip, limit)
+        cached = _get_cached_lookup(cache_key)
+        if cached is not None:
+            return cached
+
         query = db.query(Platform)
 
         if is_active is not None:
             query = query.filter(Platform.is_active == is_active)
 
-        return query.offset(skip).limit(limit).all()
+        platforms = query.offset(skip).limit(limit).all()
+        return _cache_lookup(cache_key, [platform_to_dict(p) for p in platforms])
 
     @staticmethod
     def update_platform(db: Session, platform_id: int, platform_data: PlatformUpdate) -> Platform:
         """Update a platform"""
         platform = PlatformService.get_platform(db, platform_id)
 
-        update_data = platform_data.model_dump(exclude_unset=True)
+        update_data = _set_fields(platform_data)
 
         if 'slug' in update_data and update_data['slug']:
-            existing = db.query(Platform).filter(
+            slug_taken = db.execute(select(exists().where(
                 Platform.slug == update_data['slug'],
                 Platform.id != platform_id
-            ).first()
-            if existing:
+            ))).scalar()
+            if slug_taken:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Platform with slug '{update_data['slug']}' already exists"
@@ -313,25 +665,36 @@ class PlatformService:
         for key, value in update_data.items():
             setattr(platform, key, value)
 
-        db.commit()
-        db.refresh(platform)
+        commit_detached(db, platform)
+        invalidate_entity_cache("product")
+        invalidate_lookup_cache("platforms")
         return platform
 
     @staticmethod
     def delete_platform(db: Session, platform_id: int) -> bool:
-        """Delete a platform"""
-        platform = PlatformService.get_platform(db, platform_id)
+        """Delete a platform (only if it has no categories)"""
+        # Delete and child check in one statement
+        deleted = db.execute(
+            delete(Platform)
+            .where(
+                Platform.id == platform_id,
+                ~exists().where(Category.platform_id == platform_id)
+            )
+            .returning(Platform.id)
+        ).first()
 
-        # Check if platform has categories
-        categories = db.query(Category).filter(Category.platform_id == platform_id).first()
-        if categories:
+        if deleted is None:
+            # Nothing deleted - either missing (404) or has categories
+            PlatformService.get_platform(db, platform_id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete platform with associated categories"
             )
 
-        db.delete(platform)
         db.commit()
+        invalidate_entity_cache("product")
+        invalidate_lookup_cache("platforms")
+        _forget_exists(db, Platform, platform_id)
         return True
 
 
@@ -347,26 +710,30 @@ class BrandService:
         """Create a new brand"""
         slug = brand_data.slug or generate_slug(brand_data.name)
 
-        existing = db.query(Brand).filter(Brand.slug == slug).first()
-        if existing:
+        slug_taken = db.execute(select(exists().where(Brand.slug == slug))).scalar()
+        if slug_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Brand with slug '{slug}' already exists"
             )
 
-        brand = Brand(
-            name=brand_data.name,
-            slug=slug,
-            logo_cloudinary_url=brand_data.logo_cloudinary_url,
-            logo_folder_path=brand_data.logo_folder_path,
-            logo_public_id=brand_data.logo_public_id,
-            logo_width=brand_data.logo_width,
-            logo_height=brand_data.logo_height,
-            is_active=brand_data.is_active
-        )
-        db.add(brand)
-        db.commit()
-        db.refresh(brand)
+        # INSERT ... RETURNING gives back id/created_at without a refresh SELECT
+        brand = db.execute(
+            insert(Brand)
+            .values(
+                name=brand_data.name,
+                slug=slug,
+                logo_cloudinary_url=brand_data.logo_cloudinary_url,
+                logo_folder_path=brand_data.logo_folder_path,
+                logo_public_id=brand_data.logo_public_id,
+                logo_width=brand_data.logo_width,
+                logo_height=brand_data.logo_height,
+                is_active=brand_data.is_active
+            )
+            .returning(Brand)
+        ).scalar_one()
+        commit_detached(db, brand)
+        invalidate_lookup_cache("brands")
         return brand
 
     @staticmethod
@@ -398,8 +765,13 @@ class BrandService:
         search: Optional[str] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Brand]:
-        """List brands with optional filters"""
+    ) -> List[dict]:
+        """List brands with optional filters (cached, returned as dicts)"""
+        cache_key = ("brands", is_active, search, skip, limit)
+        cached = _get_cached_lookup(cache_key)
+        if cached is not None:
+            return cached
+
         query = db.query(Brand)
 
         if is_active is not None:
@@ -408,21 +780,22 @@ class BrandService:
         if search:
             query = query.filter(Brand.name.ilike(f"%{search}%"))
 
-        return query.order_by(Brand.name).offset(skip).limit(limit).all()
+        brands = query.order_by(Brand.name).offset(skip).limit(limit).all()
+        return _cache_lookup(cache_key, [brand_to_dict(b) for b in brands])
 
     @staticmethod
     def update_brand(db: Session, brand_id: int, brand_data: BrandUpdate) -> Brand:
         """Update a brand"""
         brand = BrandService.get_brand(db, brand_id)
 
-        update_data = brand_data.model_dump(exclude_unset=True)
+        update_data = _set_fields(brand_data)
 
         if 'slug' in update_data and update_data['slug']:
-            existing = db.query(Brand).filter(
+            slug_taken = db.execute(select(exists().where(
                 Brand.slug == update_data['slug'],
                 Brand.id != brand_id
-            ).first()
-            if existing:
+            ))).scalar()
+            if slug_taken:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Brand with slug '{update_data['slug']}' already exists"
@@ -431,25 +804,36 @@ class BrandService:
         for key, value in update_data.items():
             setattr(brand, key, value)
 
-        db.commit()
-        db.refresh(brand)
+        commit_detached(db, brand)
+        invalidate_entity_cache("product")
+        invalidate_lookup_cache("brands")
         return brand
 
     @staticmethod
     def delete_brand(db: Session, brand_id: int) -> bool:
-        """Delete a brand"""
-        brand = BrandService.get_brand(db, brand_id)
+        """Delete a brand (only if it has no products)"""
+        # Delete and child check in one statement
+        deleted = db.execute(
+            delete(Brand)
+            .where(
+                Brand.id == brand_id,
+                ~exists().where(Product.brand_id == brand_id)
+            )
+            .returning(Brand.id)
+        ).first()
 
-        # Check if brand has products
-        products = db.query(Product).filter(Product.brand_id == brand_id).first()
-        if products:
+        if deleted is None:
+            # Nothing deleted - either missing (404) or has products
+            BrandService.get_brand(db, brand_id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete brand with associated products"
             )
 
-        db.delete(brand)
         db.commit()
+        invalidate_entity_cache("product")
+        invalidate_lookup_cache("brands")
+        _forget_exists(db, Brand, brand_id)
         return True
 
 
@@ -465,16 +849,16 @@ class CategoryService:
         """Create a new category"""
         slug = category_data.slug or generate_slug(category_data.name)
 
-        existing = db.query(Category).filter(Category.slug == slug).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Category with slug '{slug}' already exists"
+        # Platform and parent checks in one round-trip
+        platform_found, parent_found = db.execute(
+            select(
+                exists().where(Platform.id == category_data.platform_id),
+                exists().where(Category.id == category_data.parent_id),
             )
+        ).one()
 
         # Verify platform exists
-        platform = db.query(Platform).filter(Platform.id == category_data.platform_id).first()
-        if not platform:
+        if not platform_found:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Platform with ID {category_data.platform_id} not found"
@@ -482,23 +866,27 @@ class CategoryService:
 
         # Validate parent exists if provided
         if category_data.parent_id:
-            parent = db.query(Category).filter(Category.id == category_data.parent_id).first()
-            if not parent:
+            if not parent_found:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Parent category with ID {category_data.parent_id} not found"
                 )
 
-        category = Category(
+        # Slug uniqueness is enforced by the insert itself
+        category = _insert_unless_slug_taken(db, Category, dict(
             name=category_data.name,
             slug=slug,
             platform_id=category_data.platform_id,
             parent_id=category_data.parent_id,
             is_active=category_data.is_active
-        )
-        db.add(category)
-        db.commit()
-        db.refresh(category)
+        ))
+        if category is None:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Category with slug '{slug}' already exists"
+            )
+        commit_detached(db, category)
         return category
 
     @staticmethod
@@ -512,6 +900,15 @@ class CategoryService:
             )
         return category
 
+    @staticmethod
+    def get_category_dict(db: Session, category_id: int) -> dict:
+        """Get a category as a dict, read through the entity cache"""
+        key = ("category", category_id)
+        cached = _get_cached_entity(key)
+        if cached is not None:
+            return cached
+        return _cache_entity(key, category_to_dict(CategoryService.get_category(db, category_id)))
+
     @staticmethod
     def get_category_by_slug(db: Session, slug: str) -> Category:
         """Get a category by slug"""
@@ -557,14 +954,14 @@ class CategoryService:
         """Update a category"""
         category = CategoryService.get_category(db, category_id)
 
-        update_data = category_data.model_dump(exclude_unset=True)
+        update_data = _set_fields(category_data)
 
         if 'slug' in update_data and update_data['slug']:
-            existing = db.query(Category).filter(
+            slug_taken = db.execute(select(exists().where(
                 Category.slug == update_data['slug'],
                 Category.id != category_id
-            ).first()
-            if existing:
+            ))).scalar()
+            if slug_taken:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Category with slug '{update_data['slug']}' already exists"
@@ -572,8 +969,7 @@ class CategoryService:
 
         # Validate platform if provided
         if 'platform_id' in update_data and update_data['platform_id']:
-            platform = db.query(Platform).filter(Platform.id == update_data['platform_id']).first()
-            if not platform:
+            if not _exists_cached(db, Platform, update_data['platform_id']):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Platform with ID {update_data['platform_id']} not found"
@@ -582,8 +978,8 @@ class CategoryService:
         for key, value in update_data.items():
             setattr(category, key, value)
 
-        db.commit()
-        db.refresh(category)
+        commit_detached(db, category)
+        invalidate_entity_cache("category", category_id)
         return category
 
     @staticmethod
@@ -592,16 +988,16 @@ class CategoryService:
         category = CategoryService.get_category(db, category_id)
 
         # Check if category has children
-        children = db.query(Category).filter(Category.parent_id == category_id).first()
-        if children:
+        has_children = db.execute(select(exists().where(Category.parent_id == category_id))).scalar()
+        if has_children:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete category with child categories"
             )
 
         # Check if category has catalogues
-        catalogues = db.query(Catalogue).filter(Catalogue.category_id == category_id).first()
-        if catalogues:
+        has_catalogues = db.execute(select(exists().where(Catalogue.category_id == category_id))).scalar()
+        if has_catalogues:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cannot delete category with associated catalogues"
@@ -609,6 +1005,8 @@ class CategoryService:
 
         db.delete(category)
         db.commit()
+        invalidate_entity_cache("category", category_id)
+        _forget_exists(db, Category, category_id)
         return True
 
 
@@ -624,22 +1022,15 @@ class CatalogueService:
         """Create a new catalogue (article/design)"""
         slug = catalogue_data.slug or generate_slug(catalogue_data.name)
 
-        existing = db.query(Catalogue).filter(Catalogue.slug == slug).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Catalogue with slug '{slug}' already exists"
-            )
-
         # Validate category
-        category = db.query(Category).filter(Category.id == catalogue_data.category_id).first()
-        if not category:
+        if not _exists_cached(db, Category, catalogue_data.category_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Category with ID {catalogue_data.category_id} not found"
             )
 
-        catalogue = Catalogue(
+        # Slug uniqueness is enforced by the insert itself
+        catalogue = _insert_unless_slug_taken(db, Catalogue, dict(
             name=catalogue_data.name,
             slug=slug,
             description=catalogue_data.description,
@@ -647,10 +1038,14 @@ class CatalogueService:
             gender=catalogue_data.gender.value if catalogue_data.gender else "unisex",
             banner_media_id=catalogue_data.banner_media_id,
             is_active=catalogue_data.is_active
-        )
-        db.add(catalogue)
-        db.commit()
-        db.refresh(catalogue)
+        ))
+        if catalogue is None:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Catalogue with slug '{slug}' already exists"
+            )
+        commit_detached(db, catalogue)
         return catalogue
 
     @staticmethod
@@ -664,6 +1059,15 @@ class CatalogueService:
             )
         return catalogue
 
+    @staticmethod
+    def get_catalogue_dict(db: Session, catalogue_id: int) -> dict:
+        """Get a catalogue as a dict, read through the entity cache"""
+        key = ("catalogue", catalogue_id)
+        cached = _get_cached_entity(key)
+        if cached is not None:
+            return cached
+        return _cache_entity(key, catalogue_to_dict(CatalogueService.get_catalogue(db, catalogue_id)))
+
     @staticmethod
     def get_catalogue_by_slug(db: Session, slug: str) -> Catalogue:
         """Get a catalogue by slug"""
@@ -701,14 +1105,14 @@ class CatalogueService:
         """Update a catalogue"""
         catalogue = CatalogueService.get_catalogue(db, catalogue_id)
 
-        update_data = catalogue_data.model_dump(exclude_unset=True)
+        update_data = _set_fields(catalogue_data)
 
         if 'slug' in update_data and update_data['slug']:
-            existing = db.query(Catalogue).filter(
+            slug_taken = db.execute(select(exists().where(
                 Catalogue.slug == update_data['slug'],
                 Catalogue.id != catalogue_id
-            ).first()
-            if existing:
+            ))).scalar()
+            if slug_taken:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Catalogue with slug '{update_data['slug']}' already exists"
@@ -716,8 +1120,7 @@ class CatalogueService:
 
         # Validate category if provided
         if 'category_id' in update_data and update_data['category_id']:
-            category = db.query(Category).filter(Category.id == update_data['category_id']).first()
-            if not category:
+            if not _exists_cached(db, Category, update_data['category_id']):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Category with ID {update_data['category_id']} not found"
@@ -730,8 +1133,8 @@ class CatalogueService:
         for key, value in update_data.items():
             setattr(catalogue, key, value)
 
-        db.commit()
-        db.refresh(catalogue)
+        commit_detached(db, catalogue)
+        invalidate_entity_cache("catalogue", catalogue_id)
         return catalogue
 
     @staticmethod
@@ -750,13 +1153,21 @@ class CatalogueService:
         # Thanks to cascade="all, delete-orphan" on Catalogue.products
         db.delete(catalogue)
         db.commit()
+        invalidate_entity_cache("catalogue", catalogue_id)
+        _forget_exists(db, Catalogue, catalogue_id)
         return True
 
     @staticmethod
     def get_catalogue_products(db: Session, catalogue_id: int) -> List[Product]:
         """Get all products (color SKUs) in a catalogue"""
-        CatalogueService.get_catalogue(db, catalogue_id)
-        return db.query(Product).filter(Product.catalogue_id == catalogue_id).all()
+        products = db.query(Product).options(*PRODUCT_EAGER).filter(Product.catalogue_id == catalogue_id).all()
+        # Only an empty result needs the catalogue itself checked for a 404
+        if not products and not db.execute(select(exists().where(Catalogue.id == catalogue_id))).scalar():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Catalogue with ID {catalogue_id} not found"
+            )
+        return products
 
 
 # ========================
@@ -766,6 +1177,80 @@ class CatalogueService:
 class ProductService:
     """Service for product operations - Product = Color SKU"""
 
+    @staticmethod
+    def _product_values(product_data: ProductCreate, slug: str) -> dict:
+        """Column values for a new product row"""
+        tags, has_featured_tag = _pack_tags(product_data.tags)
+        return {
+            "name": product_data.name,
+            "slug": slug,
+            "catalogue_id": product_data.catalogue_id,
+            "brand_id": product_data.brand_id,
+            "color": product_data.color,
+            "color_hex": product_data.color_hex,
+            # Normalize color for filtering
+            "color_normalized": normalize_color(product_data.color) if product_data.color else None,
+            "price": product_data.price or product_data.mrp,
+            "mrp": product_data.mrp,
+            "short_description": product_data.short_description,
+            "long_description": product_data.long_description,
+            "is_featured": product_data.is_featured or has_featured_tag,
+            "tags": tags,
+            "status": product_data.status.value,
+            "meta_title": product_data.meta_title,
+            "meta_description": product_data.meta_description,
+        }
+
+    @staticmethod
+    def _insert_variants(db: Session, product_variants: List[tuple]) -> List[int]:
+        """
+        Insert variants and their options with one multi-row INSERT per table.
+        product_variants: (product_id, ProductVariantCreate) pairs.
+        Returns the new variant ids in input order.
+        """
+        if not product_variants:
+            return []
+
+        variant_rows = []
+        variant_options = []  # option dicts per variant row, in the same order
+        for product_id, variant_data in product_variants:
+            variant_rows.append({
+                "product_id": product_id,
+                "sku": variant_data.sku,
+                "variant_name": variant_data.size,
+                "price_override": variant_data.price_override,
+                "mrp_override": variant_data.mrp_override,
+                "is_active": variant_data.is_active,
+            })
+            options = []
+            # Size option with stock quantity
+            if variant_data.size:
+                options.append({
+                    "option_name": "size",
+                    "option_value": str(variant_data.size),
+                    "stock_quantity": variant_data.stock_quantity,
+                    "is_available": variant_data.stock_quantity > 0,
+                })
+            # Additional options if provided
+            options.extend(option_data.model_dump() for option_data in variant_data.options)
+            variant_options.append(options)
+
+        variant_ids = db.scalars(
+            insert(ProductVariant)
+            .returning(ProductVariant.id, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True),
+            variant_rows
+        ).all()
+
+        option_rows = [
+            {"variant_id": variant_id, **option}
+            for variant_id, options in zip(variant_ids, variant_options)
+            for option in options
+        ]
+        if option_rows:
+            db.execute(insert(VariantOption).execution_options(render_nulls=True), option_rows)
+        return variant_ids
+
     @staticmethod
     def create_product(db: Session, product_data: ProductCreate) -> Product:
         """
@@ -773,35 +1258,51 @@ class ProductService:
         catalogue_id is REQUIRED.
         Products can belong to multiple categories.
         """
-        print(f"[DEBUG] Creating product: {product_data.name}")
-        print(f"[DEBUG] catalogue_id: {product_data.catalogue_id}, brand_id: {product_data.brand_id}")
-        print(f"[DEBUG] category_ids: {product_data.category_ids}")
+        logger.debug(
+            "Creating product %s (catalogue_id=%s, brand_id=%s, category_ids=%s)",
+            product_data.name, product_data.catalogue_id, product_data.brand_id,
+            product_data.category_ids
+        )
         
         slug = product_data.slug or generate_slug(product_data.name)
-        print(f"[DEBUG] Generated slug: {slug}")
-
-        # Check if slug already exists
-        existing = db.query(Product).filter(Product.slug == slug).first()
-        if existing:
-            print(f"[DEBUG] Slug already exists: {slug}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Product with slug '{slug}' already exists"
+        logger.debug("Generated slug: %s", slug)
+
+        # All independent validation in one round-trip: catalogue (and its
+        # default category), requested categories and brand
+        requested_ids = list(dict.fromkeys(product_data.category_ids or []))
+        catalogue_category = (
+            select(Catalogue.category_id)
+            .where(Catalogue.id == product_data.catalogue_id)
+            .scalar_subquery()
+        )
+        (
+            catalogue_found, catalogue_category_id, catalogue_category_found,
+            found_count, brand_found
+        ) = db.execute(
+            select(
+                exists().where(Catalogue.id == product_data.catalogue_id),
+                catalogue_category,
+                exists().where(Category.id == catalogue_category),
+                select(func.count(Category.id))
+                .where(Category.id.in_(requested_ids))
+                .scalar_subquery(),
+                exists().where(Brand.id == product_data.brand_id),
             )
+        ).one()
 
         # Verify catalogue exists (required)
-        catalogue = db.query(Catalogue).filter(Catalogue.id == product_data.catalogue_id).first()
-        if not catalogue:
-            print(f"[DEBUG] Catalogue not found: {product_data.catalogue_id}")
+        if not catalogue_found:
+            logger.debug("Catalogue not found: %s", product_data.catalogue_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Catalogue with ID {product_data.catalogue_id} not found"
             )
 
         # If no categories provided, use catalogue's category
-        category_ids = product_data.category_ids or []
-        if not category_ids and catalogue.category_id:
-            category_ids = [catalogue.category_id]
+        category_ids = requested_ids
+        if not category_ids and catalogue_category_id:
+            category_ids = [catalogue_category_id]
+            found_count = 1 if catalogue_category_found else 0
         
         if not category_ids:
             raise HTTPException(
@@ -809,10 +1310,11 @@ class ProductService:
                 detail="Product must have at least one category"
             )
 
-        # Verify all categories exist
-        categories = db.query(Category).filter(Category.id.in_(category_ids)).all()
-        if len(categories) != len(category_ids):
-            found_ids = {cat.id for cat in categories}
+        # Verify all categories exist; ids are only re-read to report misses
+        if found_count != len(category_ids):
+            found_ids = set(db.execute(
+                select(Category.id).where(Category.id.in_(category_ids))
+            ).scalars())
             missing_ids = set(category_ids) - found_ids
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -821,8 +1323,7 @@ class ProductService:
 
         # Verify brand if provided
         if product_data.brand_id:
-            brand = db.query(Brand).filter(Brand.id == product_data.brand_id).first()
-            if not brand:
+            if not brand_found:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Brand with ID {product_data.brand_id} not found"
@@ -830,69 +1331,30 @@ class ProductService:
 
         # Wrap entire creation in try-except for full transaction rollback
         try:
-            # Normalize color for filtering
-            color_normalized = normalize_color(product_data.color) if product_data.color else None
-            
-            # Create product
-            product = Product(
-                name=product_data.name,
-                slug=slug,
-                catalogue_id=product_data.catalogue_id,
-                brand_id=product_data.brand_id,
-                color=product_data.color,
-                color_hex=product_data.color_hex,
-                color_normalized=color_normalized,
-                price=product_data.price or product_data.mrp,
-                mrp=product_data.mrp,
-                short_description=product_data.short_description,
-                long_description=product_data.long_description,
-                is_featured=product_data.is_featured or ('featured' in product_data.tags),
-                tags=','.join(product_data.tags) if product_data.tags else None,
-                status=product_data.status.value,
-                meta_title=product_data.meta_title,
-                meta_description=product_data.meta_description,
+            # Create product; slug uniqueness is enforced by the insert itself
+            product = _insert_unless_slug_taken(
+                db, Product, ProductService._product_values(product_data, slug)
             )
-            db.add(product)
-            db.flush()  # Get product ID without committing
+            if product is None:
+                logger.debug("Slug already exists: %s", slug)
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Product with slug '{slug}' already exists"
+                )
             
             # Associate product with categories
-            product.categories = categories
-            db.flush()
+            db.execute(insert(product_categories), [
+                {"product_id": product.id, "category_id": category_id}
+                for category_id in category_ids
+            ])
 
-            # Create variants (sizes)
-            for variant_data in product_data.variants:
-                variant = ProductVariant(
-                    product_id=product.id,
-                    sku=variant_data.sku,
-                    variant_name=variant_data.size,
-                    price_override=variant_data.price_override,
-                    mrp_override=variant_data.mrp_override,
-                    is_active=variant_data.is_active
-                )
-                db.add(variant)
-                db.flush()
-
-                # Create a size option with stock quantity
-                if variant_data.size:
-                    size_option = VariantOption(
-                        variant_id=variant.id,
-                        option_name="size",
-                        option_value=str(variant_data.size),
-                        stock_quantity=variant_data.stock_quantity,
-                        is_available=variant_data.stock_quantity > 0
-                    )
-                    db.add(size_option)
-
-                # Create additional options if provided
-                for option_data in variant_data.options:
-                    option = VariantOption(
-                        variant_id=variant.id,
-                        option_name=option_data.option_name,
-                        option_value=option_data.option_value,
-                        stock_quantity=option_data.stock_quantity,
-                        is_available=option_data.is_available
-                    )
-                    db.add(option)
+            if product_data.tags:
+                db.execute(insert(ProductTag), _tag_rows(product.id, product_data.tags))
+
+            # Create variants (sizes) and their options in bulk
+            ProductService._insert_variants(
+                db, [(product.id, variant_data) for variant_data in product_data.variants]
+            )
 
             # Create footwear details if provided
             if product_data.footwear_details:
@@ -902,17 +1364,19 @@ class ProductService:
                 )
                 db.add(footwear)
 
+            product_id = product.id
             db.commit()
-            db.refresh(product)
-            print(f"[DEBUG] Product created successfully: {product.id}")
-            return product
+            logger.debug("Product created successfully: %s", product_id)
+            # Reload with the eager graph callers serialize, instead of a
+            # refresh followed by one lazy load per relationship
+            return ProductService.get_product(db, product_id)
             
         except HTTPException:
             db.rollback()
             raise
         except Exception as e:
             db.rollback()
-            print(f"[DEBUG] Transaction rollback due to error: {str(e)}")
+            logger.exception("Product creation rolled back")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to create product: {str(e)}"
@@ -921,9 +1385,7 @@ class ProductService:
     @staticmethod
     def get_product(db: Session, product_id: int) -> Product:
         """Get a product by ID with all related data"""
-        product = db.query(Product).options(
-            joinedload(Product.categories)
-        ).filter(Product.id == product_id).first()
+        product = db.query(Product).options(*PRODUCT_EAGER).filter(Product.id == product_id).first()
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -934,7 +1396,7 @@ class ProductService:
     @staticmethod
     def get_product_by_slug(db: Session, slug: str) -> Product:
         """Get a product by slug"""
-        product = db.query(Product).filter(Product.slug == slug).first()
+        product = db.query(Product).options(*PRODUCT_EAGER).filter(Product.slug == slug).first()
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -942,6 +1404,21 @@ class ProductService:
             )
         return product
 
+    @staticmethod
+    def get_live_product_dict_by_slug(db: Session, slug: str) -> dict:
+        """
+        Get a LIVE product as a dict (storefront PDP), read through the
+        entity cache. Drafts, archived and soft-deleted products are 404.
+        """
+        key = ("product", slug)
+        cached = _get_cached_entity(key)
+        if cached is not None:
+            return cached
+        product = ProductService.get_product_by_slug(db, slug)
+        if product.status != "live" or product.deleted_at is not None:
+            raise HTTPException(status_code=404, detail="Product not found")
+        return _cache_entity(key, product_to_dict(product))
+
     @staticmethod
     def list_products(
         db: Session,
@@ -957,10 +1434,7 @@ class ProductService:
         limit: int = 100
     ) -> tuple[List[Product], int]:
         """List products with filters and pagination"""
-        query = db.query(Product).options(
-            joinedload(Product.catalogue),
-            joinedload(Product.brand)
-        )
+        query = db.query(Product)
 
         if catalogue_id is not None:
             query = query.filter(Product.catalogue_id == catalogue_id)
@@ -968,13 +1442,17 @@ class ProductService:
         if brand_id is not None:
             query = query.filter(Product.brand_id == brand_id)
         
+        # Gender and platform both filter through the catalogue; join it once
+        if gender or platform_slug:
+            query = query.join(Catalogue)
+
         # Filter by gender (from catalogue)
         if gender:
-            query = query.join(Catalogue).filter(Catalogue.gender == gender)
+            query = query.filter(Catalogue.gender == gender)
         
         # Filter by platform (from catalogue -> category -> platform)
         if platform_slug:
-            query = query.join(Catalogue).join(Category).join(Platform).filter(Platform.slug == platform_slug)
+            query = query.join(Category).join(Platform).filter(Platform.slug == platform_slug)
         
         if status:
             query = query.filter(Product.status == status)
@@ -985,8 +1463,24 @@ class ProductService:
         if max_price is not None:
             query = query.filter(Product.price <= max_price)
 
-        total = query.count()
-        products = query.offset(skip).limit(limit).all()
+        # Page and total in one round-trip via COUNT(*) OVER ()
+        rows = (
+            query.add_columns(func.count().over().label("total"))
+            .options(*PRODUCT_LIST_EAGER)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        products = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total
+        elif skip:
+            # Page past the end - the window gives no rows, so count separately
+            total = db.execute(
+                select(func.count()).select_from(query.statement.subquery())
+            ).scalar_one()
+        else:
+            total = 0
 
         return products, total
 
@@ -995,14 +1489,14 @@ class ProductService:
         """Update a product"""
         product = ProductService.get_product(db, product_id)
 
-        update_data = product_data.model_dump(exclude_unset=True)
+        update_data = _set_fields(product_data)
 
         if 'slug' in update_data and update_data['slug']:
-            existing = db.query(Product).filter(
+            slug_taken = db.execute(select(exists().where(
                 Product.slug == update_data['slug'],
                 Product.id != product_id
-            ).first()
-            if existing:
+            ))).scalar()
+            if slug_taken:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Product with slug '{update_data['slug']}' already exists"
@@ -1011,15 +1505,36 @@ class ProductService:
         # Handle category_ids - update many-to-many relationship
         category_ids = update_data.pop('category_ids', None)
         if category_ids is not None:
-            categories = db.query(Category).filter(Category.id.in_(category_ids)).all()
-            if len(categories) != len(category_ids):
-                found_ids = {cat.id for cat in categories}
-                missing_ids = set(category_ids) - found_ids
+            desired_ids = set(category_ids)
+            found_ids = set(db.execute(
+                select(Category.id).where(Category.id.in_(desired_ids))
+            ).scalars())
+            missing_ids = desired_ids - found_ids
+            if missing_ids:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Categories not found: {missing_ids}"
                 )
-            product.categories = categories
+
+            # Diff against the link table: one DELETE and one INSERT at most
+            existing_ids = set(db.execute(
+                select(product_categories.c.category_id)
+                .where(product_categories.c.product_id == product.id)
+            ).scalars())
+            removed_ids = existing_ids - desired_ids
+            added_ids = desired_ids - existing_ids
+            if removed_ids:
+                db.execute(
+                    delete(product_categories).where(
+                        product_categories.c.product_id == product.id,
+                        product_categories.c.category_id.in_(removed_ids)
+                    )
+                )
+            if added_ids:
+                db.execute(insert(product_categories), [
+                    {"product_id": product.id, "category_id": category_id}
+                    for category_id in added_ids
+                ])
 
         # Handle status enum
         if 'status' in update_data and update_data['status']:
@@ -1027,9 +1542,12 @@ class ProductService:
         
         # Handle tags - convert list to comma-separated string
         if 'tags' in update_data and update_data['tags'] is not None:
-            update_data['tags'] = ','.join(update_data['tags']) if update_data['tags'] else None
+            # Keep the product_tags filter rows in step with the tag string
+            db.execute(delete(ProductTag).where(ProductTag.product_id == product.id))
+            if update_data['tags']:
+                db.execute(insert(ProductTag), _tag_rows(product.id, update_data['tags']))
             # Also update is_featured if 'featured' tag is present
-            update_data['is_featured'] = 'featured' in (update_data['tags'] or '')
+            update_data['tags'], update_data['is_featured'] = _pack_tags(update_data['tags'])
 
         # Handle footwear_details separately
         footwear_data = update_data.pop('footwear_details', None)
@@ -1047,8 +1565,8 @@ class ProductService:
 
         product.updated_at = datetime.utcnow()
         db.commit()
-        db.refresh(product)
-        return product
+        invalidate_entity_cache("product")
+        return ProductService.get_product(db, product_id)
 
     @staticmethod
     def delete_product(db: Session, product_id: int) -> bool:
@@ -1066,6 +1584,7 @@ class ProductService:
         # Thanks to cascade="all, delete-orphan" on Product relationships
         db.delete(product)
         db.commit()
+        invalidate_entity_cache("product")
         return True
 
     @staticmethod
@@ -1075,36 +1594,57 @@ class ProductService:
         Includes the current product to show all available colors.
         Used for PDP color switching.
         """
-        product = ProductService.get_product(db, product_id)
-        
-        # Get ALL products in the same catalogue (including current one)
-        sibling_products = db.query(Product).filter(
-            Product.catalogue_id == product.catalogue_id,
-            Product.status == "live"
+        catalogue_id = db.execute(
+            select(Product.catalogue_id).where(Product.id == product_id)
+        ).scalar_one_or_none()
+        if catalogue_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Product with ID {product_id} not found"
+            )
+
+        # ALL live products in the catalogue (including current one) with their
+        # primary image URL, in a single query
+        rows = db.execute(
+            select(
+                Product.id, Product.name, Product.color, Product.color_hex,
+                Product.slug, MediaAsset.cloudinary_url
+            )
+            .outerjoin(
+                MediaAsset,
+                and_(MediaAsset.product_id == Product.id, MediaAsset.is_primary == True)
+            )
+            .where(Product.catalogue_id == catalogue_id, Product.status == "live")
+            .order_by(Product.id, MediaAsset.id)
         ).all()
-        
+
         color_options = []
-        for p in sibling_products:
-            # Get primary image URL
-            primary_image = db.query(MediaAsset).filter(
-                MediaAsset.product_id == p.id,
-                MediaAsset.is_primary == True
-            ).first()
-            
+        seen = set()
+        for p_id, name, color, color_hex, slug, image_url in rows:
+            # Guard against more than one asset flagged primary
+            if p_id in seen:
+                continue
+            seen.add(p_id)
             color_options.append(ColorOption(
-                product_id=p.id,
-                name=p.name,
-                color=p.color,
-                color_hex=p.color_hex,
-                slug=p.slug,
-                primary_image_url=primary_image.cloudinary_url if primary_image else None
+                product_id=p_id,
+                name=name,
+                color=color,
+                color_hex=color_hex,
+                slug=slug,
+                primary_image_url=image_url
             ))
-        
+
         return color_options
 
     @staticmethod
     def bulk_upload_products(db: Session, bulk_data: BulkProductUpload) -> dict:
-        """Bulk upload products"""
+        """
+        Bulk upload products.
+        Every row is validated against a handful of batched lookups, then all
+        valid rows are written with one multi-row INSERT per table (products,
+        category links, variants, options, footwear details) in one transaction.
+        Invalid rows are reported individually, as before.
+        """
         results = {
             "total": len(bulk_data.products),
             "successful": 0,
@@ -1112,25 +1652,124 @@ class ProductService:
             "errors": []
         }
 
-        for idx, product_data in enumerate(bulk_data.products):
-            try:
-                ProductService.create_product(db, product_data)
-                results["successful"] += 1
-            except HTTPException as e:
-                results["failed"] += 1
-                results["errors"].append({
-                    "index": idx,
-                    "product_name": product_data.name,
-                    "error": e.detail
-                })
-            except Exception as e:
-                results["failed"] += 1
-                results["errors"].append({
-                    "index": idx,
-                    "product_name": product_data.name,
-                    "error": str(e)
-                })
+        def record_error(idx: int, product_data: ProductCreate, error) -> None:
+            results["failed"] += 1
+            results["errors"].append({
+                "index": idx,
+                "product_name": product_data.name,
+                "error": error
+            })
+
+        products = bulk_data.products
+        slugs = [p.slug or generate_slug(p.name) for p in products]
+        catalogue_ids = {p.catalogue_id for p in products}
+        brand_ids = {p.brand_id for p in products if p.brand_id}
+        skus = {v.sku for p in products for v in p.variants if v.sku}
+
+        # Batched lookups - one query per referenced table
+        taken_slugs = set(db.scalars(select(Product.slug).where(Product.slug.in_(slugs))))
+        catalogue_category = dict(db.execute(
+            select(Catalogue.id, Catalogue.category_id).where(Catalogue.id.in_(catalogue_ids))
+        ).all())
+        requested_category_ids = {cid for p in products for cid in (p.category_ids or [])}
+        requested_category_ids.update(cid for cid in catalogue_category.values() if cid)
+        known_category_ids = set(db.scalars(
+            select(Category.id).where(Category.id.in_(requested_category_ids))
+        ))
+        known_brand_ids = set(db.scalars(select(Brand.id).where(Brand.id.in_(brand_ids))))
+        taken_skus = set(db.scalars(select(ProductVariant.sku).where(ProductVariant.sku.in_(skus))))
+
+        # Validate rows in order (same checks and messages as create_product)
+        valid = []  # (idx, product_data, slug, category_ids)
+        for idx, (product_data, slug) in enumerate(zip(products, slugs)):
+            if slug in taken_slugs:
+                record_error(idx, product_data, f"Product with slug '{slug}' already exists")
+                continue
+            if product_data.catalogue_id not in catalogue_category:
+                record_error(idx, product_data, f"Catalogue with ID {product_data.catalogue_id} not found")
+                continue
+
+            category_ids = product_data.category_ids or []
+            if not category_ids and catalogue_category[product_data.catalogue_id]:
+                category_ids = [catalogue_category[product_data.catalogue_id]]
+            if not category_ids:
+                record_error(idx, product_data, "Product must have at least one category")
+                continue
+            missing_ids = set(category_ids) - known_category_ids
+            if missing_ids:
+                record_error(idx, product_data, f"Categories not found: {missing_ids}")
+                continue
+
+            if product_data.brand_id and product_data.brand_id not in known_brand_ids:
+                record_error(idx, product_data, f"Brand with ID {product_data.brand_id} not found")
+                continue
+
+            row_skus = [v.sku for v in product_data.variants if v.sku]
+            duplicate_sku = next(
+                (sku for i, sku in enumerate(row_skus) if sku in taken_skus or sku in row_skus[:i]),
+                None
+            )
+            if duplicate_sku:
+                record_error(idx, product_data, f"Variant with SKU '{duplicate_sku}' already exists")
+                continue
+
+            taken_slugs.add(slug)
+            taken_skus.update(row_skus)
+            valid.append((idx, product_data, slug, list(dict.fromkeys(category_ids))))
+
+        if not valid:
+            return results
 
+        try:
+            # Slugs are unique, so map ids back by slug rather than relying on
+            # RETURNING order (not guaranteed by SQLite)
+            product_id_by_slug = dict(db.execute(
+                insert(Product).returning(Product.slug, Product.id).execution_options(render_nulls=True),
+                [ProductService._product_values(product_data, slug) for _, product_data, slug, _ in valid]
+            ).all())
+            product_ids = [product_id_by_slug[slug] for _, _, slug, _ in valid]
+
+            category_links = []
+            tag_rows = []
+            product_variants = []
+            footwear_rows = []
+            for product_id, (_, product_data, _, category_ids) in zip(product_ids, valid):
+                category_links.extend(
+                    {"product_id": product_id, "category_id": cid} for cid in category_ids
+                )
+                tag_rows.extend(_tag_rows(product_id, product_data.tags))
+                product_variants.extend((product_id, variant_data) for variant_data in product_data.variants)
+                if product_data.footwear_details:
+                    footwear_rows.append({
+                        "product_id": product_id,
+                        **product_data.footwear_details.model_dump()
+                    })
+
+            db.execute(insert(product_categories), category_links)
+            if tag_rows:
+                db.execute(insert(ProductTag), tag_rows)
+            ProductService._insert_variants(db, product_variants)
+
+            if footwear_rows:
+                db.execute(insert(FootwearDetails).execution_options(render_nulls=True), footwear_rows)
+
+            db.commit()
+            results["successful"] += len(valid)
+
+        except IntegrityError:
+            # Lost a race on a unique slug/SKU - fall back to row-by-row so
+            # each product still gets its own success/error entry
+            db.rollback()
+            for idx, product_data, _, _ in valid:
+                try:
+                    ProductService.create_product(db, product_data)
+                    results["successful"] += 1
+                except HTTPException as e:
+                    record_error(idx, product_data, e.detail)
+                except Exception as e:
+                    record_error(idx, product_data, str(e))
+
+        results["errors"].sort(key=lambda error: error["index"])
         return results
 
 
@@ -1152,41 +1791,19 @@ class VariantService:
                 detail=f"Product with ID {product_id} not found"
             )
 
-        # Check for duplicate SKU
-        if variant_data.sku:
-            existing = db.query(ProductVariant).filter(ProductVariant.sku == variant_data.sku).first()
-            if existing:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Variant with SKU '{variant_data.sku}' already exists"
-                )
-
-        variant = ProductVariant(
-            product_id=product_id,
-            sku=variant_data.sku,
-            size=variant_data.size,
-            stock_quantity=variant_data.stock_quantity,
-            price_override=variant_data.price_override,
-            mrp_override=variant_data.mrp_override,
-            is_active=variant_data.is_active
-        )
-        db.add(variant)
-        db.flush()
-
-        # Create options
-        for option_data in variant_data.options:
-            option = VariantOption(
-                variant_id=variant.id,
-                option_name=option_data.option_name,
-                option_value=option_data.option_value,
-                stock_quantity=option_data.stock_quantity,
-                is_available=option_data.is_available
+        # Variant row plus all of its options in one multi-row INSERT; a
+        # duplicate SKU is caught by the unique constraint on sku
+        try:
+            variant_id, = ProductService._insert_variants(db, [(product_id, variant_data)])
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Variant with SKU '{variant_data.sku}' already exists"
             )
-            db.add(option)
-
-        db.commit()
-        db.refresh(variant)
-        return variant
+        invalidate_entity_cache("product")
+        return VariantService.get_variant(db, variant_id)
 
     @staticmethod
     def get_variant(db: Session, variant_id: int) -> ProductVariant:
@@ -1202,47 +1819,81 @@ class VariantService:
     @staticmethod
     def update_variant(db: Session, variant_id: int, variant_data: ProductVariantUpdate) -> ProductVariant:
         """Update a variant"""
-        variant = VariantService.get_variant(db, variant_id)
+        update_data = _set_fields(variant_data)
 
-        update_data = variant_data.model_dump(exclude_unset=True)
+        # Only set columns that exist on the model
+        values = {key: value for key, value in update_data.items() if key in ProductVariant.__table__.c}
 
-        if 'sku' in update_data and update_data['sku']:
-            existing = db.query(ProductVariant).filter(
-                ProductVariant.sku == update_data['sku'],
-                ProductVariant.id != variant_id
-            ).first()
-            if existing:
+        # A duplicate SKU is caught by the unique constraint on sku
+        try:
+            if values:
+                found = db.execute(
+                    update(ProductVariant)
+                    .where(ProductVariant.id == variant_id)
+                    .values(**values)
+                    .returning(ProductVariant.id)
+                    .execution_options(synchronize_session=False)
+                ).first()
+            else:
+                found = db.execute(select(exists().where(ProductVariant.id == variant_id))).scalar()
+            if not found:
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Variant with SKU '{update_data['sku']}' already exists"
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Variant with ID {variant_id} not found"
                 )
 
-        # Handle stock_quantity - update on all options since stock is stored at option level
-        if 'stock_quantity' in update_data:
-            new_stock = update_data.pop('stock_quantity')  # Remove from update_data
-            # Update all options for this variant with the new stock quantity
-            for option in (variant.options or []):
-                option.stock_quantity = new_stock
-                option.is_available = new_stock > 0
-
-        for key, value in update_data.items():
-            if hasattr(variant, key):  # Only set attributes that exist on the model
-                setattr(variant, key, value)
+            # Handle stock_quantity - stock is stored at option level, so set
+            # it on all of the variant's options in one UPDATE
+            if 'stock_quantity' in update_data:
+                new_stock = update_data['stock_quantity']
+                db.execute(
+                    update(VariantOption)
+                    .where(VariantOption.variant_id == variant_id)
+                    .values(stock_quantity=new_stock, is_available=new_stock > 0)
+                    .execution_options(synchronize_session=False)
+                )
 
-        db.commit()
-        db.refresh(variant)
-        return variant
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Variant with SKU '{update_data.get('sku')}' already exists"
+            )
+        invalidate_entity_cache("product")
+        return VariantService.get_variant(db, variant_id)
 
     @staticmethod
     def delete_variant(db: Session, variant_id: int) -> bool:
         """Delete a variant and its options"""
-        variant = VariantService.get_variant(db, variant_id)
+        # Set-based DELETEs, children first; nothing is loaded into the session.
+        # The FKs declare ON DELETE CASCADE, but SQLite only honours it with
+        # PRAGMA foreign_keys on, so the children are removed explicitly.
+        db.execute(
+            delete(VariantOption).where(VariantOption.variant_id == variant_id)
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            delete(MediaAsset).where(MediaAsset.variant_id == variant_id)
+            .execution_options(synchronize_session=False)
+        )
+        deleted = db.execute(
+            delete(ProductVariant).where(ProductVariant.id == variant_id)
+            .returning(ProductVariant.product_id)
+            .execution_options(synchronize_session=False)
+        ).first()
 
-        # Delete associated media
-        db.query(MediaAsset).filter(MediaAsset.variant_id == variant_id).delete()
+        if deleted is None:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Variant with ID {variant_id} not found"
+            )
 
-        db.delete(variant)
+        # The variant's media may have included the product's primary image
+        sync_primary_image(db, deleted.product_id)
         db.commit()
+        invalidate_entity_cache("product")
         return True
 
 
@@ -1271,8 +1922,8 @@ class VariantOptionService:
             is_available=option_data.is_available
         )
         db.add(option)
-        db.commit()
-        db.refresh(option)
+        commit_detached(db, option)
+        invalidate_entity_cache("product")
         return option
 
     @staticmethod
@@ -1289,15 +1940,15 @@ class VariantOptionService:
     @staticmethod
     def update_option(db: Session, option_id: int, option_data: VariantOptionUpdate) -> VariantOption:
         """Update an option"""
-        option = VariantOptionService.get_option(db, option_id)
-
-        update_data = option_data.model_dump(exclude_unset=True)
-
-        for key, value in update_data.items():
-            setattr(option, key, value)
+        option = _update_returning(db, VariantOption, option_id, _set_fields(option_data))
+        if option is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Option with ID {option_id} not found"
+            )
 
-        db.commit()
-        db.refresh(option)
+        commit_detached(db, option)
+        invalidate_entity_cache("product")
         return option
 
     @staticmethod
@@ -1306,8 +1957,8 @@ class VariantOptionService:
         option = VariantOptionService.get_option(db, option_id)
         option.stock_quantity = quantity
         option.is_available = quantity > 0
-        db.commit()
-        db.refresh(option)
+        commit_detached(db, option)
+        invalidate_entity_cache("product")
         return option
 
     @staticmethod
@@ -1316,6 +1967,7 @@ class VariantOptionService:
         option = VariantOptionService.get_option(db, option_id)
         db.delete(option)
         db.commit()
+        invalidate_entity_cache("product")
         return True
 
 
@@ -1323,12 +1975,31 @@ class VariantOptionService:
 # Media Asset Service
 # ========================
 
+# Enum-typed MediaAssetUpdate fields, stored by value
+MEDIA_ENUM_FIELDS = ('media_type', 'usage_type', 'platform')
+
+
 class MediaAssetService:
     """Service for media asset operations"""
 
+    @staticmethod
+    def _clear_primary(db: Session, product_id: int, usage_type: str, keep_id: Optional[int] = None) -> None:
+        """Unset the product's primary media of a usage type (one allowed per ix_media_primary_per_product)"""
+        query = update(MediaAsset).where(
+            MediaAsset.product_id == product_id,
+            MediaAsset.usage_type == usage_type,
+            MediaAsset.is_primary == True
+        )
+        if keep_id:
+            query = query.where(MediaAsset.id != keep_id)
+        db.execute(query.values(is_primary=False).execution_options(synchronize_session=False))
+
     @staticmethod
     def create_media(db: Session, media_data: MediaAssetCreate) -> MediaAsset:
         """Create a new media asset"""
+        if media_data.is_primary and media_data.product_id:
+            MediaAssetService._clear_primary(db, media_data.product_id, media_data.usage_type.value)
+
         media = MediaAsset(
             product_id=media_data.product_id,
             variant_id=media_data.variant_id,
@@ -1345,8 +2016,9 @@ class MediaAssetService:
             is_primary=media_data.is_primary
         )
         db.add(media)
-        db.commit()
-        db.refresh(media)
+        sync_primary_image(db, media.product_id)
+        commit_detached(db, media)
+        invalidate_entity_cache("product")
         return media
 
     @staticmethod
@@ -1377,23 +2049,42 @@ class MediaAssetService:
     @staticmethod
     def update_media(db: Session, media_id: int, media_data: MediaAssetUpdate) -> MediaAsset:
         """Update a media asset"""
-        media = MediaAssetService.get_media(db, media_id)
-
-        update_data = media_data.model_dump(exclude_unset=True)
+        update_data = _set_fields(media_data)
 
         # Handle enum values
-        if 'media_type' in update_data and update_data['media_type']:
-            update_data['media_type'] = update_data['media_type'].value
-        if 'usage_type' in update_data and update_data['usage_type']:
-            update_data['usage_type'] = update_data['usage_type'].value
-        if 'platform' in update_data and update_data['platform']:
-            update_data['platform'] = update_data['platform'].value
+        for field in MEDIA_ENUM_FIELDS:
+            value = update_data.get(field)
+            if value:
+                update_data[field] = value.value
+
+        # A row that ends up primary (promoted, or a primary moved to another
+        # usage type) has to clear that slot first, which needs the current
+        # product/usage type; other updates never load the row
+        if 'is_primary' in update_data or 'usage_type' in update_data:
+            current = MediaAssetService.get_media(db, media_id)
+            if current.product_id and update_data.get('is_primary', current.is_primary):
+                MediaAssetService._clear_primary(
+                    db, current.product_id, update_data.get('usage_type') or current.usage_type, keep_id=media_id
+                )
 
-        for key, value in update_data.items():
-            setattr(media, key, value)
+        try:
+            media = _update_returning(db, MediaAsset, media_id, update_data)
+            if media is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Media asset with ID {media_id} not found"
+                )
+            sync_primary_image(db, media.product_id)
 
-        db.commit()
-        db.refresh(media)
+            commit_detached(db, media)
+        except IntegrityError:
+            # Lost a race for the primary slot (ix_media_primary_per_product)
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Another primary media asset already exists for this product and usage type"
+            )
+        invalidate_entity_cache("product")
         return media
 
     @staticmethod
@@ -1401,29 +2092,48 @@ class MediaAssetService:
         """Delete a media asset"""
         media = MediaAssetService.get_media(db, media_id)
         db.delete(media)
+        sync_primary_image(db, media.product_id)
         db.commit()
+        invalidate_entity_cache("product")
         return True
 
     @staticmethod
     def set_primary_media(db: Session, product_id: int, media_id: int) -> MediaAsset:
         """Set a media asset as primary for a product"""
-        # Reset all product media to non-primary
-        db.query(MediaAsset).filter(
-            MediaAsset.product_id == product_id
-        ).update({"is_primary": False})
+        # Clear the current primaries first (ix_media_primary_per_product
+        # allows one per usage type), then flip the target. Both UPDATEs
+        # only touch primary rows or the target, via the partial index.
+        db.execute(
+            update(MediaAsset)
+            .where(
+                MediaAsset.product_id == product_id,
+                MediaAsset.is_primary == True,
+                MediaAsset.id != media_id
+            )
+            .values(is_primary=False)
+            .execution_options(synchronize_session=False)
+        )
+        updated = db.execute(
+            update(MediaAsset)
+            .where(MediaAsset.id == media_id, MediaAsset.product_id == product_id)
+            .values(is_primary=True)
+            .returning(MediaAsset.id)
+            .execution_options(synchronize_session=False)
+        ).first()
 
-        # Set the specified media as primary
-        media = MediaAssetService.get_media(db, media_id)
-        if media.product_id != product_id:
+        if updated is None:
+            db.rollback()
+            # 404 if the media doesn't exist at all, otherwise it's another product's
+            MediaAssetService.get_media(db, media_id)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Media asset does not belong to this product"
             )
 
-        media.is_primary = True
+        sync_primary_image(db, product_id)
         db.commit()
-        db.refresh(media)
-        return media
+        invalidate_entity_cache("product")
+        return MediaAssetService.get_media(db, media_id)
 
 
 # ========================
@@ -1447,17 +2157,44 @@ class ProductListingService:
         max_price: Optional[int] = None,
         in_stock_only: bool = False,
         skip: int = 0,
-        limit: int = 20
+        limit: int = 20,
+        cursor: Optional[str] = None
     ) -> tuple:
         """
         Get optimized product listing with pre-joined primary image.
-        Returns (items, total, filters_applied)
+        Pass the previous page's next_cursor to seek (skip is then ignored);
+        cursor pages skip the count and return total as None.
+        Returns (items, total, filters_applied, next_cursor)
         """
+        cache_key = (
+            category_id, catalogue_id, platform_slug, brand_id, gender, is_featured,
+            tags, min_price, max_price, in_stock_only, skip, limit, cursor
+        )
+        cached = _get_cached_listing(cache_key)
+        if cached is not None:
+            return cached
+
         # Base query - exclude deleted and non-live products for public listing
+        # Only the columns the listing items are built from are loaded
         query = db.query(Product).options(
-            joinedload(Product.catalogue).joinedload(Catalogue.category).joinedload(Category.platform),
-            joinedload(Product.brand),
-            joinedload(Product.variants).joinedload(ProductVariant.options)
+            load_only(
+                Product.name, Product.slug, Product.brand_id, Product.catalogue_id,
+                Product.price, Product.mrp, Product.color, Product.color_hex,
+                Product.is_featured, Product.tags, Product.status,
+                Product.short_description, Product.primary_image_url, Product.created_at
+            ),
+            joinedload(Product.catalogue).load_only(Catalogue.category_id, Catalogue.gender)
+            .joinedload(Catalogue.category).load_only(Category.platform_id)
+            .joinedload(Category.platform).load_only(Platform.slug),
+            joinedload(Product.brand).load_only(Brand.name),
+            # Stock and the size fallback are column properties on the
+            # variant (deferred, undeferred here by load_only), so option
+            # rows are never loaded
+            selectinload(Product.variants).load_only(
+                ProductVariant.product_id, ProductVariant.variant_name, ProductVariant.is_active,
+                ProductVariant.deleted_at, ProductVariant.total_stock, ProductVariant.size_option_value
+            ),
+            *STRICT_LOADING
         ).filter(
             Product.deleted_at.is_(None),
             Product.status == "live"
@@ -1490,11 +2227,17 @@ class ProductListingService:
             query = query.filter(Product.is_featured == is_featured)
             filters_applied["is_featured"] = is_featured
 
-        # Filter by tags
+        # Filter by tags - products carrying every requested tag, resolved
+        # from the (tag, product_id) index instead of LIKE scans
         if tags:
-            tag_list = [tag.strip().lower() for tag in tags.split(',') if tag.strip()]
-            for tag in tag_list:
-                query = query.filter(Product.tags.ilike(f"%{tag}%"))
+            tag_list = list(dict.fromkeys(tag.strip().lower() for tag in tags.split(',') if tag.strip()))
+            if tag_list:
+                query = query.filter(Product.id.in_(
+                    select(ProductTag.product_id)
+                    .where(ProductTag.tag.in_(tag_list))
+                    .group_by(ProductTag.product_id)
+                    .having(func.count() == len(tag_list))
+                ))
             filters_applied["tags"] = tag_list
 
         if min_price is not None:
@@ -1505,24 +2248,62 @@ class ProductListingService:
             query = query.filter(Product.price <= max_price)
             filters_applied["max_price"] = max_price
 
-        # Get total count
-        total = query.count()
-
-        # Get products
-        products = query.order_by(Product.is_featured.desc(), Product.created_at.desc())\
-            .offset(skip).limit(limit).all()
+        listing_order = (Product.is_featured.desc(), Product.created_at.desc(), Product.id.desc())
+        if cursor:
+            # Keyset seek - every sort column is DESC, so "after" is a row-value <.
+            # The total was returned with the first page, so don't count again
+            products = query.filter(
+                tuple_(Product.is_featured, Product.created_at, Product.id) < _decode_listing_cursor(cursor)
+            ).order_by(*listing_order).limit(limit).all()
+            total = None
+        else:
+            # Page and total in one round-trip via COUNT(*) OVER ()
+            rows = query.add_columns(func.count().over().label("total"))\
+                .order_by(*listing_order).offset(skip).limit(limit).all()
+            products = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            elif skip:
+                # Page past the end - count the whole filtered set separately
+                total = db.execute(
+                    select(func.count()).select_from(
+                        query.with_entities(Product.id).subquery()
+                    )
+                ).scalar_one()
+            else:
+                total = 0
+        next_cursor = _encode_listing_cursor(products[-1]) if len(products) == limit else None
+
+        # Available colors for every catalogue on the page in one query
+        # (same design, different colors), de-duplicated by color name
+        colors_by_catalogue = {}
+        catalogue_ids = {p.catalogue_id for p in products if p.catalogue_id}
+        if catalogue_ids:
+            color_rows = db.query(
+                Product.catalogue_id, Product.color, Product.color_hex, Product.id
+            ).filter(
+                Product.catalogue_id.in_(catalogue_ids),
+                Product.deleted_at.is_(None),
+                Product.status == "live",
+                Product.color.isnot(None)
+            ).order_by(Product.id).all()
+            seen_colors = set()
+            for cat_id, color, color_hex, product_id in color_rows:
+                if not color or (cat_id, color) in seen_colors:
+                    continue
+                seen_colors.add((cat_id, color))
+                colors_by_catalogue.setdefault(cat_id, []).append({
+                    'name': color,
+                    'hex': color_hex,
+                    'product_id': product_id
+                })
 
         # Build listing items with pre-joined data
         listing_items = []
         for product in products:
-            # Get primary image
-            primary_image = db.query(MediaAsset).filter(
-                MediaAsset.product_id == product.id,
-                MediaAsset.is_primary == True,
-                MediaAsset.deleted_at.is_(None)
-            ).first()
-
-            primary_image_url = primary_image.cloudinary_url if primary_image else None
+            primary_image_url = product.primary_image_url
+            category = product.catalogue.category if product.catalogue else None
+            platform = category.platform if category else None
             primary_image_alt = product.name
 
             # Check stock availability and collect available sizes
@@ -1530,15 +2311,10 @@ class ProductListingService:
             available_sizes = []
             for v in product.variants:
                 if v.deleted_at is None and v.is_active:
-                    variant_stock = sum(opt.stock_quantity or 0 for opt in (v.options or []))
-                    if variant_stock > 0:
+                    if v.total_stock > 0:
                         in_stock = True
-                        # Get size from variant_name or first option
-                        size = v.variant_name
-                        if not size and v.options:
-                            size_option = next((o for o in v.options if o.option_name == 'size'), None)
-                            if size_option:
-                                size = size_option.option_value
+                        # Get size from variant_name or the size option
+                        size = v.variant_name or v.size_option_value
                         if size and size not in available_sizes:
                             available_sizes.append(size)
 
@@ -1552,26 +2328,10 @@ class ProductListingService:
                 discount_percentage = round(((product.mrp - product.price) / product.mrp) * 100, 1)
 
             # Get product tags as list
-            product_tags = product.get_tags_list() if hasattr(product, 'get_tags_list') else []
-
-            # Get all available colors for this catalogue (same design, different colors)
-            available_colors = []
-            if product.catalogue_id:
-                # Get all products in the same catalogue (same design, different colors)
-                color_variants = db.query(Product).filter(
-                    Product.catalogue_id == product.catalogue_id,
-                    Product.deleted_at.is_(None),
-                    Product.status == "live",
-                    Product.color.isnot(None)
-                ).all()
-                
-                for cv in color_variants:
-                    if cv.color and cv.color not in [c['name'] for c in available_colors]:
-                        available_colors.append({
-                            'name': cv.color,
-                            'hex': cv.color_hex,
-                            'product_id': cv.id
-                        })
+            product_tags = _product_tags_list(product)
+
+            # All available colors for this catalogue (batched above)
+            available_colors = colors_by_catalogue.get(product.catalogue_id, [])
 
             listing_items.append({
                 "id": product.id,
@@ -1589,7 +2349,7 @@ class ProductListingService:
                 "gender": product.gender,
                 "color": product.color,
                 "color_hex": product.color_hex,
-                "platform_slug": product.platform.slug if product.platform else None,
+                "platform_slug": platform.slug if platform else None,
                 "is_featured": product.is_featured,
                 "tags": product_tags,
                 "status": product.status,
@@ -1600,7 +2360,16 @@ class ProductListingService:
                 "created_at": product.created_at
             })
 
-        return listing_items, total, filters_applied
+        _release_strict_loads(db, [
+            obj for p in products
+            for obj in (
+                p, p.brand, p.catalogue,
+                p.catalogue and p.catalogue.category,
+                p.catalogue and p.catalogue.category and p.catalogue.category.platform,
+                *p.variants
+            )
+        ])
+        return _cache_listing(cache_key, (listing_items, total, filters_applied, next_cursor))
 
 
 # ========================
@@ -1613,7 +2382,14 @@ class AvailabilityService:
     @staticmethod
     def get_product_availability(db: Session, product_id: int) -> dict:
         """Get complete availability information for a product."""
-        product = db.query(Product).filter(
+        product = db.query(Product).options(
+            # Stock and the size fallback are computed in SQL
+            # (ProductVariant.total_stock / size_option_value, deferred)
+            selectinload(Product.variants).options(
+                undefer(ProductVariant.total_stock), undefer(ProductVariant.size_option_value)
+            ),
+            *STRICT_LOADING
+        ).filter(
             Product.id == product_id,
             Product.deleted_at.is_(None)
         ).first()
@@ -1632,14 +2408,10 @@ class AvailabilityService:
             if variant.deleted_at is not None or not variant.is_active:
                 continue
 
-            # Calculate stock from options (stock is stored at option level)
-            variant_stock = sum(opt.stock_quantity or 0 for opt in (variant.options or []))
-            # Get size from variant_name or first option
-            size = variant.variant_name
-            if not size and variant.options:
-                size_option = next((o for o in variant.options if o.option_name == 'size'), None)
-                if size_option:
-                    size = size_option.option_value
+            # Stock is stored at option level, summed in SQL
+            variant_stock = variant.total_stock
+            # Get size from variant_name or the size option
+            size = variant.variant_name or variant.size_option_value
             
             if variant_stock > 0:
                 product_available = True
@@ -1652,6 +2424,7 @@ class AvailabilityService:
                 "is_available": variant_stock > 0 and variant.is_active
             })
 
+        _release_strict_loads(db, [product, *product.variants])
         return {
             "product_id": product.id,
             "product_name": product.name,
@@ -1673,22 +2446,34 @@ class SlugService:
     @staticmethod
     def generate_unique_slug(db: Session, base_slug: str, model_class, exclude_id: Optional[int] = None) -> str:
         """Generate a unique slug by appending numbers if needed."""
-        slug = base_slug
-        counter = 1
-
-        while True:
-            query = db.query(model_class).filter(model_class.slug == slug)
-            if exclude_id:
-                query = query.filter(model_class.id != exclude_id)
-
-            if hasattr(model_class, 'deleted_at'):
-                query = query.filter(model_class.deleted_at.is_(None))
+        # Every taken "base" / "base-N" slug in one query, then pick the
+        # first free counter locally
+        query = db.query(model_class.slug).filter(
+            (model_class.slug == base_slug)
+            | model_class.slug.startswith(f"{base_slug}-", autoescape=True)
+        )
+        if exclude_id:
+            query = query.filter(model_class.id != exclude_id)
 
-            if not query.first():
-                return slug
+        if hasattr(model_class, 'deleted_at'):
+            query = query.filter(model_class.deleted_at.is_(None))
 
+        suffix_pattern = re.compile(rf"{re.escape(base_slug)}-(\d+)")
+        taken = set()
+        for (slug,) in query.all():
+            if slug == base_slug:
+                taken.add(1)
+            else:
+                match = suffix_pattern.fullmatch(slug)
+                if match:
+                    taken.add(int(match.group(1)))
+
+        if 1 not in taken:
+            return base_slug
+        counter = 2
+        while counter in taken:
             counter += 1
-            slug = f"{base_slug}-{counter}"
+        return f"{base_slug}-{counter}"
 
 
 # ========================
@@ -1701,51 +2486,60 @@ class SoftDeleteService:
     @staticmethod
     def soft_delete_product(db: Session, product_id: int) -> Product:
         """Soft delete a product"""
-        product = db.query(Product).filter(
-            Product.id == product_id,
-            Product.deleted_at.is_(None)
+        now = datetime.utcnow()
+        deleted = db.execute(
+            update(Product)
+            .where(Product.id == product_id, Product.deleted_at.is_(None))
+            .values(deleted_at=now, status="archived")
+            .returning(Product.id)
+            .execution_options(synchronize_session=False)
         ).first()
 
-        if not product:
+        if deleted is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Product with ID {product_id} not found"
             )
 
-        product.deleted_at = datetime.utcnow()
-        product.status = "archived"
-
-        # Also soft delete variants
-        for variant in product.variants:
-            variant.deleted_at = datetime.utcnow()
+        # Also soft delete variants, in one UPDATE without loading them
+        db.execute(
+            update(ProductVariant)
+            .where(ProductVariant.product_id == product_id)
+            .values(deleted_at=now)
+            .execution_options(synchronize_session=False)
+        )
 
         db.commit()
-        db.refresh(product)
-        return product
+        invalidate_entity_cache("product")
+        return ProductService.get_product(db, product_id)
 
     @staticmethod
     def restore_product(db: Session, product_id: int) -> Product:
         """Restore a soft-deleted product"""
-        product = db.query(Product).filter(
-            Product.id == product_id,
-            Product.deleted_at.isnot(None)
+        restored = db.execute(
+            update(Product)
+            .where(Product.id == product_id, Product.deleted_at.isnot(None))
+            .values(deleted_at=None, status="draft")
+            .returning(Product.id)
+            .execution_options(synchronize_session=False)
         ).first()
 
-        if not product:
+        if restored is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Deleted product with ID {product_id} not found"
             )
 
-        product.deleted_at = None
-        product.status = "draft"
-
-        for variant in product.variants:
-            variant.deleted_at = None
+        db.execute(
+            update(ProductVariant)
+            .where(ProductVariant.product_id == product_id)
+            .values(deleted_at=None)
+            .execution_options(synchronize_session=False)
+        )
 
         db.commit()
-        db.refresh(product)
-        return product
+        invalidate_entity_cache("product")
+        return ProductService.get_product(db, product_id)
 
 
 
@@ -2,10 +2,14 @@
 Media Upload Service
 Handles R2 (Cloudflare) uploads and database operations for media assets
 """
-from typing import Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any, Union
+import asyncio
+import hashlib
 import logging
+import time
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, delete, literal, update
+from sqlalchemy.orm import Session, joinedload
 from fastapi import UploadFile
 
 from database.db_models import (
@@ -28,7 +32,9 @@ from utils.r2_config import (
     get_allowed_types,
     extract_object_path_from_url
 )
+from services.catalogue_service import commit_detached, invalidate_entity_cache, sync_primary_image
 from utils.exceptions import (
+    EcommerceException,
     ResourceNotFoundException,
     ValidationException,
     BusinessRuleException
@@ -36,10 +42,39 @@ from utils.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Upload size limits
+MAX_IMAGE_SIZE = 10 * 1024 * 1024
+MAX_VIDEO_SIZE = 100 * 1024 * 1024
+
+# Max R2 uploads in flight at once for a bulk upload request
+BULK_UPLOAD_CONCURRENCY = 4
+
+# How long a successful R2 health check is reused (the endpoint is polled)
+R2_HEALTH_CACHE_SECONDS = 30
+
+# Primary-unset statements, built once (served by ix_media_primary_by_product
+# / ix_media_primary_by_variant). 'fetch' syncs loaded rows from RETURNING -
+# the bound values can't be evaluated in Python, and callers re-set
+# is_primary on a row that may have just been cleared
+_UNSET_PRIMARY_BY_PRODUCT = update(MediaAsset).where(
+    MediaAsset.is_primary == True,
+    MediaAsset.product_id == bindparam('b_product_id'),
+    MediaAsset.usage_type == bindparam('b_usage_type')
+).values(is_primary=False).execution_options(synchronize_session='fetch')
+
+_UNSET_PRIMARY_BY_VARIANT = update(MediaAsset).where(
+    MediaAsset.is_primary == True,
+    MediaAsset.variant_id == bindparam('b_variant_id'),
+    MediaAsset.usage_type == bindparam('b_usage_type')
+).values(is_primary=False).execution_options(synchronize_session='fetch')
+
 
 class MediaUploadService:
     """Service for handling media uploads to R2 and database operations"""
 
+    # (monotonic time, result) of the last successful R2 health check
+    _last_r2_check: Optional[tuple] = None
+
     def __init__(self):
         """Initialize the service"""
         pass
@@ -74,9 +109,14 @@ class MediaUploadService:
                 details={"allowed_types": allowed_types}
             )
 
-        # Check file size (max 10MB for images, 100MB for videos)
-        max_size = 100 * 1024 * 1024 if media_type == "video" else 10 * 1024 * 1024
-        if file.size and file.size > max_size:
+        # Check file size (max 10MB for images, 100MB for videos) from the
+        # size Starlette recorded while parsing, or the part's declared
+        # length - never by reading the file
+        max_size = MAX_VIDEO_SIZE if media_type == "video" else MAX_IMAGE_SIZE
+        size = file.size
+        if size is None and file.headers.get("content-length", "").isdigit():
+            size = int(file.headers["content-length"])
+        if size and size > max_size:
             raise ValidationException(
                 message=f"File too large. Max size: {max_size / (1024 * 1024)}MB",
                 field="file"
@@ -90,17 +130,27 @@ class MediaUploadService:
         Returns:
             Tuple of (Product, ProductVariant)
         """
-        product = db.query(Product).filter(Product.id == product_id).first()
-        if not product:
-            raise ResourceNotFoundException(resource="Product", resource_id=product_id)
-
-        variant = db.query(ProductVariant).filter(
-            ProductVariant.id == variant_id,
-            ProductVariant.product_id == product_id
-        ).first()
+        # One round-trip: the variant is outer-joined so a missing variant
+        # still tells apart from a missing product, and the catalogue ->
+        # category -> platform chain and brand (used to build the object
+        # path) come back eagerly instead of as lazy SELECTs
+        row = db.query(Product, ProductVariant).outerjoin(
+            ProductVariant,
+            and_(
+                ProductVariant.id == variant_id,
+                ProductVariant.product_id == Product.id
+            )
+        ).options(
+            joinedload(Product.catalogue).joinedload(Catalogue.category).joinedload(Category.platform),
+            joinedload(Product.brand)
+        ).filter(Product.id == product_id).first()
+        if not row:
+            raise ResourceNotFoundException(resource_type="Product", resource_id=product_id)
+
+        product, variant = row
         if not variant:
             raise ResourceNotFoundException(
-                resource="ProductVariant",
+                resource_type="ProductVariant",
                 resource_id=variant_id,
                 details={"product_id": product_id}
             )
@@ -110,17 +160,17 @@ class MediaUploadService:
     @staticmethod
     def validate_catalogue(db: Session, catalogue_id: int) -> Catalogue:
         """Validate that catalogue exists"""
-        catalogue = db.query(Catalogue).filter(Catalogue.id == catalogue_id).first()
+        catalogue = db.get(Catalogue, catalogue_id)
         if not catalogue:
-            raise ResourceNotFoundException(resource="Catalogue", resource_id=catalogue_id)
+            raise ResourceNotFoundException(resource_type="Catalogue", resource_id=catalogue_id)
         return catalogue
 
     @staticmethod
     def validate_category(db: Session, category_id: int) -> Category:
         """Validate that category exists"""
-        category = db.query(Category).filter(Category.id == category_id).first()
+        category = db.get(Category, category_id)
         if not category:
-            raise ResourceNotFoundException(resource="Category", resource_id=category_id)
+            raise ResourceNotFoundException(resource_type="Category", resource_id=category_id)
         return category
 
     # ========================
@@ -146,21 +196,18 @@ class MediaUploadService:
             BusinessRuleException: If upload fails
         """
         try:
-            # Read file content
-            content = await file.read()
-
             # Determine content type
             content_type = get_content_type(file.filename)
 
-            # Upload to R2
-            public_url = r2_client.upload_file(
-                file_content=content,
+            # Stream the spooled upload to R2 without reading it into memory;
+            # boto3 blocks, so run it off the event loop
+            public_url = await asyncio.to_thread(
+                r2_client.upload_fileobj,
+                fileobj=file.file,
                 object_path=object_path,
                 content_type=content_type
             )
 
-            logger.info(f"Successfully uploaded to R2: {object_path}")
-
             return {
                 "public_url": public_url,
                 "object_path": object_path,
@@ -169,15 +216,66 @@ class MediaUploadService:
             }
 
         except Exception as e:
-            logger.error(f"R2 upload failed for {object_path}: {str(e)}")
+            logger.error("R2 upload failed for %s: %s", object_path, e)
             raise BusinessRuleException(
                 message=f"Upload failed: {str(e)}",
                 rule="r2_upload",
                 details={"object_path": object_path, "error": str(e)}
             )
-        finally:
-            # Reset file position for potential retry
-            await file.seek(0)
+
+    async def upload_to_r2_alongside(
+        self,
+        file: UploadFile,
+        object_path: str,
+        db_work: Callable[[], None]
+    ) -> Dict[str, Any]:
+        """
+        Upload file to R2 while running pending DB work concurrently.
+
+        The object path is built from DB lookups, so those run first; what
+        remains (e.g. clearing the current primary) overlaps the upload.
+        db_work runs in a worker thread - the session isn't touched by
+        anything else until both finish.
+
+        Returns:
+            Upload result with public URL
+        """
+        upload_result, _ = await asyncio.gather(
+            self.upload_to_r2(file, object_path),
+            asyncio.to_thread(db_work)
+        )
+        return upload_result
+
+    @staticmethod
+    def _build_media_asset(
+        upload_result: Dict[str, Any],
+        object_path: str,
+        media_type: str,
+        usage_type: str,
+        platform: str,
+        display_order: int,
+        is_primary: bool,
+        product_id: Optional[int] = None,
+        variant_id: Optional[int] = None
+    ) -> MediaAsset:
+        """Build (but don't add) a MediaAsset for an uploaded object"""
+        return MediaAsset(
+            product_id=product_id,
+            variant_id=variant_id,
+            media_type=media_type,
+            usage_type=usage_type,
+            platform=platform,
+            cloudinary_url=upload_result["public_url"],  # Keep field name for now (will migrate later)
+            folder_path=object_path,  # Store R2 object path
+            public_id=object_path,  # Use object path as public_id
+            width=None,  # Will add image processing later
+            height=None,
+            aspect_ratio=None,
+            display_order=display_order,
+            is_primary=is_primary,
+            status="approved",
+            content_sha256=upload_result.get("content_sha256")
+        )
 
     def create_media_asset(
         self,
@@ -190,7 +288,8 @@ class MediaUploadService:
         display_order: int,
         is_primary: bool,
         product_id: Optional[int] = None,
-        variant_id: Optional[int] = None
+        variant_id: Optional[int] = None,
+        commit: bool = True
     ) -> MediaAsset:
         """
         Create media asset record in database.
@@ -206,30 +305,25 @@ class MediaUploadService:
             is_primary: Whether this is the primary media
             product_id: Optional product ID
             variant_id: Optional variant ID
+            commit: Commit the transaction; pass False to only flush (assigns
+                the id) and let the caller commit its own changes with it
 
         Returns:
             Created MediaAsset
         """
-        media_asset = MediaAsset(
-            product_id=product_id,
-            variant_id=variant_id,
-            media_type=media_type,
-            usage_type=usage_type,
-            platform=platform,
-            cloudinary_url=upload_result["public_url"],  # Keep field name for now (will migrate later)
-            folder_path=object_path,  # Store R2 object path
-            public_id=object_path,  # Use object path as public_id
-            width=None,  # Will add image processing later
-            height=None,
-            aspect_ratio=None,
-            display_order=display_order,
-            is_primary=is_primary,
-            status="approved"
+        media_asset = self._build_media_asset(
+            upload_result, object_path, media_type, usage_type, platform,
+            display_order, is_primary, product_id, variant_id
         )
 
         db.add(media_asset)
-        db.commit()
-        db.refresh(media_asset)
+        sync_primary_image(db, product_id)
+        if not commit:
+            db.flush()
+            return media_asset
+
+        commit_detached(db, media_asset)
+        invalidate_entity_cache("product")
 
         return media_asset
 
@@ -265,6 +359,243 @@ class MediaUploadService:
             db, upload_data.product_id, upload_data.variant_id
         )
 
+        # Generate deterministic object path
+        object_path = self._product_media_path(
+            product, upload_data.usage_type.value, file.filename
+        )
+
+        # Same bytes already uploaded for this product, variant and usage
+        # type: place that asset as requested instead of uploading and
+        # inserting a duplicate
+        content_sha256 = await self.hash_upload(file)
+        duplicate = self.find_duplicate_product_media(
+            db, content_sha256, upload_data.product_id,
+            upload_data.variant_id, upload_data.usage_type.value
+        )
+        if duplicate:
+            if upload_data.is_primary:
+                self._unset_primary_media(
+                    db,
+                    product_id=upload_data.product_id,
+                    usage_type=upload_data.usage_type.value
+                )
+            duplicate.is_primary = upload_data.is_primary
+            duplicate.display_order = upload_data.display_order
+            sync_primary_image(db, duplicate.product_id)
+            commit_detached(db, duplicate)
+            invalidate_entity_cache("product")
+            return duplicate
+
+        # Upload to R2; if setting as primary, unset other primary images
+        # for this PRODUCT while the upload runs
+        if upload_data.is_primary:
+            upload_result = await self.upload_to_r2_alongside(
+                file, object_path,
+                lambda: self._unset_primary_media(
+                    db,
+                    product_id=upload_data.product_id,
+                    usage_type=upload_data.usage_type.value
+                )
+            )
+        else:
+            upload_result = await self.upload_to_r2(file, object_path)
+        upload_result["content_sha256"] = content_sha256
+
+        # Create database record
+        media_asset = self.create_media_asset(
+            db=db,
+            upload_result=upload_result,
+            object_path=object_path,
+            media_type=MediaType.IMAGE.value,
+            usage_type=upload_data.usage_type.value,
+            platform=upload_data.platform.value,
+            display_order=upload_data.display_order,
+            is_primary=upload_data.is_primary,
+            product_id=upload_data.product_id,
+            variant_id=upload_data.variant_id
+        )
+
+        return media_asset
+
+    async def bulk_upload_product_variant_media(
+        self,
+        db: Session,
+        files: List[UploadFile],
+        upload_data_list: List[ProductVariantMediaUpload]
+    ) -> List[Union[MediaAsset, Exception]]:
+        """
+        Upload several files for product variants concurrently.
+
+        Each product/variant pair is validated once, up to
+        BULK_UPLOAD_CONCURRENCY uploads run at a time, and all resulting
+        MediaAssets are inserted in a single commit. Only the first primary
+        file per product and usage type is kept primary
+        (see ix_media_primary_per_product).
+
+        Files whose bytes are already stored for the same product, variant
+        and usage type reuse that asset (with this upload's is_primary and
+        display_order); repeats of a file within the batch resolve to the
+        first copy's result.
+
+        Args:
+            db: Database session
+            files: The files to upload
+            upload_data_list: Upload parameters, one per file
+
+        Returns:
+            One entry per file, in order: the created MediaAsset, or the
+            exception that made that file fail
+        """
+        results: List[Union[MediaAsset, Exception, None]] = [None] * len(files)
+
+        # Validation pre-pass (DB work stays on this thread)
+        products: Dict[tuple, Union[Product, Exception]] = {}
+        object_paths: Dict[int, str] = {}
+        for idx, (file, upload_data) in enumerate(zip(files, upload_data_list)):
+            pair = (upload_data.product_id, upload_data.variant_id)
+            try:
+                # Cheap checks first, so a bad file costs no query
+                self.validate_file(file, MediaType.IMAGE.value)
+                if pair not in products:
+                    try:
+                        products[pair] = self.validate_product_variant(db, *pair)[0]
+                    except EcommerceException as e:
+                        products[pair] = e
+                if isinstance(products[pair], Exception):
+                    raise products[pair]
+                object_paths[idx] = self._product_media_path(
+                    products[pair], upload_data.usage_type.value, file.filename
+                )
+            except EcommerceException as e:
+                results[idx] = e
+
+        # Skip files whose bytes are already stored for the same product,
+        # variant and usage type (one lookup for the whole batch), and
+        # repeats of the same file within the batch
+        hashes = dict(zip(object_paths, await asyncio.gather(
+            *(self.hash_upload(files[idx]) for idx in object_paths)
+        )))
+        existing = {}
+        if hashes:
+            for media in db.query(MediaAsset).filter(
+                MediaAsset.content_sha256.in_(set(hashes.values())),
+                MediaAsset.product_id.in_({d.product_id for d in upload_data_list}),
+                MediaAsset.variant_id.in_({d.variant_id for d in upload_data_list}),
+                MediaAsset.deleted_at.is_(None)
+            ).all():
+                existing.setdefault(
+                    (media.product_id, media.variant_id, media.usage_type, media.content_sha256),
+                    media
+                )
+
+        first_by_key: Dict[tuple, int] = {}
+        repeats: Dict[int, int] = {}  # idx -> idx of the first identical file
+        reused: Dict[int, MediaAsset] = {}  # idx -> existing asset for that file
+        for idx, content_sha256 in hashes.items():
+            upload_data = upload_data_list[idx]
+            key = (
+                upload_data.product_id, upload_data.variant_id,
+                upload_data.usage_type.value, content_sha256
+            )
+            if key in first_by_key:
+                repeats[idx] = first_by_key[key]
+                del object_paths[idx]
+                continue
+            first_by_key[key] = idx
+            if key in existing:
+                reused[idx] = existing[key]
+                del object_paths[idx]
+
+        # Fan out the uploads, bounded by the semaphore
+        semaphore = asyncio.Semaphore(BULK_UPLOAD_CONCURRENCY)
+
+        async def upload_one(idx: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.upload_to_r2(files[idx], object_paths[idx])
+
+        pending = list(object_paths)
+        uploads = await asyncio.gather(
+            *(upload_one(idx) for idx in pending), return_exceptions=True
+        )
+
+        # One transaction for every uploaded or reused file, in batch order
+        # so the first primary file wins
+        uploaded = dict(zip(pending, uploads))
+        placed: List[tuple] = []
+        primary_keys = set()
+        for idx in sorted([*pending, *reused]):
+            upload_result = uploaded.get(idx)
+            if isinstance(upload_result, Exception):
+                results[idx] = upload_result
+                continue
+
+            upload_data = upload_data_list[idx]
+            key = (upload_data.product_id, upload_data.usage_type.value)
+            is_primary = upload_data.is_primary and key not in primary_keys
+            if is_primary:
+                primary_keys.add(key)
+                self._unset_primary_media(db, product_id=key[0], usage_type=key[1])
+
+            if idx in reused:
+                media_asset = reused[idx]
+                media_asset.is_primary = is_primary
+                media_asset.display_order = upload_data.display_order
+            else:
+                upload_result["content_sha256"] = hashes[idx]
+                media_asset = self._build_media_asset(
+                    upload_result, object_paths[idx], MediaType.IMAGE.value,
+                    upload_data.usage_type.value, upload_data.platform.value,
+                    upload_data.display_order, is_primary,
+                    upload_data.product_id, upload_data.variant_id
+                )
+                db.add(media_asset)
+            placed.append((idx, media_asset))
+
+        if placed:
+            for product_id in {media_asset.product_id for _, media_asset in placed}:
+                sync_primary_image(db, product_id)
+            commit_detached(db, *(media_asset for _, media_asset in placed))
+            for idx, media_asset in placed:
+                results[idx] = media_asset
+            invalidate_entity_cache("product")
+
+        for idx, first_idx in repeats.items():
+            results[idx] = results[first_idx]
+
+        return results
+
+    @staticmethod
+    async def hash_upload(file: UploadFile) -> str:
+        """SHA-256 of the uploaded content, streamed off the event loop"""
+        digest = await asyncio.to_thread(hashlib.file_digest, file.file, "sha256")
+        await file.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def find_duplicate_product_media(
+        db: Session,
+        content_sha256: str,
+        product_id: int,
+        variant_id: int,
+        usage_type: str
+    ) -> Optional[MediaAsset]:
+        """Live media of the product/variant/usage type with the same content hash"""
+        return db.query(MediaAsset).filter(
+            MediaAsset.content_sha256 == content_sha256,
+            MediaAsset.product_id == product_id,
+            MediaAsset.variant_id == variant_id,
+            MediaAsset.usage_type == usage_type,
+            MediaAsset.deleted_at.is_(None)
+        ).first()
+
+    @staticmethod
+    def _product_media_path(product: Product, usage_type: str, filename: str) -> str:
+        """
+        Build the R2 object path for a product image.
+
+        Raises:
+            BusinessRuleException: If the product has no catalogue or platform
+        """
         # Get catalogue and platform information
         catalogue = product.catalogue
         if not catalogue:
@@ -272,8 +603,9 @@ class MediaUploadService:
                 message="Product must belong to a catalogue",
                 rule="catalogue_required"
             )
-        
-        platform = product.category.platform if product.category and product.category.platform else None
+
+        category = catalogue.category
+        platform = category.platform if category and category.platform else None
         if not platform:
             raise BusinessRuleException(
                 message="Product must belong to a platform via category",
@@ -284,43 +616,15 @@ class MediaUploadService:
         brand = product.brand
         brand_slug = brand.slug if brand else "no-brand"
 
-        # Generate deterministic object path
-        object_path = generate_product_path(
+        return generate_product_path(
             platform_slug=platform.slug,
             brand_slug=brand_slug,
             catalogue_slug=catalogue.slug,
             product_slug=product.slug,
-            usage_type=upload_data.usage_type.value,
-            filename=file.filename
-        )
-
-        # If setting as primary, unset other primary images for this PRODUCT
-        if upload_data.is_primary:
-            self._unset_primary_media(
-                db,
-                product_id=upload_data.product_id,
-                usage_type=upload_data.usage_type.value
-            )
-
-        # Upload to R2
-        upload_result = await self.upload_to_r2(file, object_path)
-
-        # Create database record
-        media_asset = self.create_media_asset(
-            db=db,
-            upload_result=upload_result,
-            object_path=object_path,
-            media_type=MediaType.IMAGE.value,
-            usage_type=upload_data.usage_type.value,
-            platform=upload_data.platform.value,
-            display_order=upload_data.display_order,
-            is_primary=upload_data.is_primary,
-            product_id=upload_data.product_id,
-            variant_id=upload_data.variant_id
+            usage_type=usage_type,
+            filename=filename
         )
 
-        return media_asset
-
     # ========================
     # Catalogue Banner
     # ========================
@@ -354,14 +658,17 @@ class MediaUploadService:
             filename=file.filename
         )
 
-        # If setting as primary, unset other primary banners
+        # Upload to R2; if setting as primary, unset other primary banners
+        # while the upload runs
         if upload_data.is_primary:
-            self._unset_catalogue_primary_banner(db, upload_data.catalogue_id)
-
-        # Upload to R2
-        upload_result = await self.upload_to_r2(file, object_path)
+            upload_result = await self.upload_to_r2_alongside(
+                file, object_path,
+                lambda: self._unset_catalogue_primary_banner(db, upload_data.catalogue_id)
+            )
+        else:
+            upload_result = await self.upload_to_r2(file, object_path)
 
-        # Create database record
+        # Create database record (committed below together with the catalogue)
         media_asset = self.create_media_asset(
             db=db,
             upload_result=upload_result,
@@ -372,13 +679,19 @@ class MediaUploadService:
             display_order=upload_data.display_order,
             is_primary=upload_data.is_primary,
             product_id=None,
-            variant_id=None
+            variant_id=None,
+            commit=False
         )
 
         # Update catalogue with banner_media_id if primary
         if upload_data.is_primary:
             catalogue.banner_media_id = media_asset.id
-            db.commit()
+
+        # Single commit for the media row and the catalogue update
+        commit_detached(db, media_asset)
+        invalidate_entity_cache("product")
+        if upload_data.is_primary:
+            invalidate_entity_cache("catalogue", catalogue.id)
 
         return media_asset
 
@@ -490,9 +803,9 @@ class MediaUploadService:
     @staticmethod
     def get_media_by_id(db: Session, media_id: int) -> MediaAsset:
         """Get media asset by ID"""
-        media = db.query(MediaAsset).filter(MediaAsset.id == media_id).first()
+        media = db.get(MediaAsset, media_id)
         if not media:
-            raise ResourceNotFoundException(resource="MediaAsset", resource_id=media_id)
+            raise ResourceNotFoundException(resource_type="MediaAsset", resource_id=media_id)
         return media
 
     @staticmethod
@@ -522,8 +835,16 @@ class MediaUploadService:
     @staticmethod
     def list_catalogue_banners(db: Session, catalogue_id: int) -> List[MediaAsset]:
         """List catalogue banners"""
-        # Catalogue banners don't have product_id, filter by usage_type
-        return db.query(MediaAsset).filter(
+        # Catalogue banners don't have product_id; they live under the
+        # catalogue's folder (see generate_catalogue_banner_path), so match
+        # on that prefix in a join instead of looking the slug up first
+        return db.query(MediaAsset).join(
+            Catalogue,
+            MediaAsset.folder_path.startswith(
+                literal("banners/catalogues/") + Catalogue.slug + "/"
+            )
+        ).filter(
+            Catalogue.id == catalogue_id,
             MediaAsset.usage_type == UsageType.BANNER.value
         ).order_by(MediaAsset.display_order).all()
 
@@ -544,19 +865,21 @@ class MediaUploadService:
 
         # Handle primary flag
         if update_dict.get('is_primary') is True:
-            # Unset other primary media for the same variant/product
-            if media.variant_id:
-                self._unset_primary_media(db, variant_id=media.variant_id, usage_type=media.usage_type)
-            elif media.product_id:
+            # Unset other primary media for the same product/variant
+            # (one per product and usage type, see ix_media_primary_per_product)
+            if media.product_id:
                 self._unset_primary_media(db, product_id=media.product_id, usage_type=media.usage_type)
+            elif media.variant_id:
+                self._unset_primary_media(db, variant_id=media.variant_id, usage_type=media.usage_type)
 
         # Apply updates
         for key, value in update_dict.items():
             if hasattr(media, key):
                 setattr(media, key, value)
 
-        db.commit()
-        db.refresh(media)
+        sync_primary_image(db, media.product_id)
+        commit_detached(db, media)
+        invalidate_entity_cache("product")
         return media
 
     def set_primary_media(
@@ -574,13 +897,18 @@ class MediaUploadService:
                 rule="variant_mismatch"
             )
 
-        # Unset other primary
-        self._unset_primary_media(db, variant_id=variant_id, usage_type=media.usage_type)
+        # Unset other primary (product-wide when the media has a product,
+        # see ix_media_primary_per_product)
+        if media.product_id:
+            self._unset_primary_media(db, product_id=media.product_id, usage_type=media.usage_type)
+        else:
+            self._unset_primary_media(db, variant_id=variant_id, usage_type=media.usage_type)
 
         # Set this as primary
         media.is_primary = True
-        db.commit()
-        db.refresh(media)
+        sync_primary_image(db, media.product_id)
+        commit_detached(db, media)
+        invalidate_entity_cache("product")
 
         return media
 
@@ -590,17 +918,22 @@ class MediaUploadService:
         media_orders: List[Dict[str, int]]
     ) -> List[MediaAsset]:
         """Bulk update display order for multiple media assets"""
-        updated = []
+        # One SELECT for every asset, then a single executemany UPDATE at flush
+        media_ids = [item['media_id'] for item in media_orders]
+        media_by_id = {
+            media.id: media
+            for media in db.query(MediaAsset).filter(MediaAsset.id.in_(media_ids)).all()
+        }
+        missing_id = next((media_id for media_id in media_ids if media_id not in media_by_id), None)
+        if missing_id is not None:
+            raise ResourceNotFoundException(resource_type="MediaAsset", resource_id=missing_id)
 
         for item in media_orders:
-            media = self.get_media_by_id(db, item['media_id'])
-            media.display_order = item['display_order']
-            updated.append(media)
-
-        db.commit()
+            media_by_id[item['media_id']].display_order = item['display_order']
 
-        for media in updated:
-            db.refresh(media)
+        updated = [media_by_id[media_id] for media_id in dict.fromkeys(media_ids)]
+        commit_detached(db, *updated)
+        invalidate_entity_cache("product")
 
         return updated
 
@@ -608,7 +941,7 @@ class MediaUploadService:
     # Delete Methods
     # ========================
 
-    def delete_media(self, db: Session, media_id: int) -> Dict[str, Any]:
+    async def delete_media(self, db: Session, media_id: int) -> Dict[str, Any]:
         """
         Delete media from R2 and database.
 
@@ -620,27 +953,37 @@ class MediaUploadService:
             Deletion result
         """
         media = self.get_media_by_id(db, media_id)
+        object_path = media.public_id  # public_id contains the object path
 
-        r2_deleted = False
+        # If this was a catalogue banner, unlink it in one UPDATE
+        unlinked_catalogue_ids = []
+        if media.usage_type == UsageType.BANNER.value and media.is_primary:
+            unlinked_catalogue_ids = db.execute(
+                update(Catalogue)
+                .where(Catalogue.banner_media_id == media_id)
+                .values(banner_media_id=None)
+                .returning(Catalogue.id)
+                .execution_options(synchronize_session=False)
+            ).scalars().all()
+
+        # Delete from database first, so a failed commit never leaves a row
+        # pointing at a removed R2 object
+        db.delete(media)
+        sync_primary_image(db, media.product_id)
+        db.commit()
 
-        # Try to delete from R2
-        if media.public_id:  # public_id contains the object path
+        # Then try to delete from R2 (boto3 blocks, so run it off the event
+        # loop); a failure only leaves an orphaned object
+        r2_deleted = False
+        if object_path:
             try:
-                r2_deleted = r2_client.delete_file(media.public_id)
+                r2_deleted = await asyncio.to_thread(r2_client.delete_file, object_path)
             except Exception as e:
-                logger.error(f"Failed to delete from R2: {str(e)}")
+                logger.error("Failed to delete from R2: %s", e, exc_info=True)
 
-        # If this was a catalogue banner, update catalogue
-        if media.usage_type == UsageType.BANNER.value and media.is_primary:
-            catalogues = db.query(Catalogue).filter(
-                Catalogue.banner_media_id == media_id
-            ).all()
-            for catalogue in catalogues:
-                catalogue.banner_media_id = None
-
-        # Delete from database
-        db.delete(media)
-        db.commit()
+        invalidate_entity_cache("product")
+        for catalogue_id in unlinked_catalogue_ids:
+            invalidate_entity_cache("catalogue", catalogue_id)
 
         return {
             "success": True,
@@ -649,6 +992,68 @@ class MediaUploadService:
             "r2_deleted": r2_deleted
         }
 
+    async def bulk_delete_media(self, db: Session, media_ids: List[int]) -> Dict[str, Any]:
+        """
+        Delete several media assets from R2 and database.
+
+        R2 objects go in DeleteObjects batches and the rows in one DELETE,
+        instead of two round-trips per asset.
+
+        Args:
+            db: Database session
+            media_ids: Media asset IDs
+
+        Returns:
+            Deletion result
+        """
+        media_ids = list(dict.fromkeys(media_ids))
+        media_list = db.query(MediaAsset).filter(MediaAsset.id.in_(media_ids)).all()
+        found_ids = {media.id for media in media_list}
+        missing_id = next((media_id for media_id in media_ids if media_id not in found_ids), None)
+        if missing_id is not None:
+            raise ResourceNotFoundException(resource_type="MediaAsset", resource_id=missing_id)
+
+        # public_id contains the object path
+        object_paths = [media.public_id for media in media_list if media.public_id]
+        product_ids = {media.product_id for media in media_list if media.product_id}
+
+        # Unlink catalogue banners, then delete the rows - committed first, so
+        # a failed commit never leaves rows pointing at removed R2 objects
+        unlinked_catalogue_ids = db.execute(
+            update(Catalogue)
+            .where(Catalogue.banner_media_id.in_(media_ids))
+            .values(banner_media_id=None)
+            .returning(Catalogue.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        db.execute(
+            delete(MediaAsset)
+            .where(MediaAsset.id.in_(media_ids))
+            .execution_options(synchronize_session=False)
+        )
+        for product_id in product_ids:
+            sync_primary_image(db, product_id)
+        db.commit()
+
+        # Then try to delete from R2; a failure only leaves orphaned objects
+        r2_deleted = 0
+        if object_paths:
+            try:
+                r2_deleted = len(await asyncio.to_thread(r2_client.delete_files, object_paths))
+            except Exception as e:
+                logger.error("Failed to delete from R2: %s", e, exc_info=True)
+
+        invalidate_entity_cache("product")
+        for catalogue_id in unlinked_catalogue_ids:
+            invalidate_entity_cache("catalogue", catalogue_id)
+
+        return {
+            "success": True,
+            "message": f"Deleted {len(media_ids)} media assets",
+            "deleted_ids": media_ids,
+            "r2_deleted": r2_deleted
+        }
+
     # ========================
     # Helper Methods
     # ========================
@@ -656,26 +1061,19 @@ class MediaUploadService:
     def _unset_primary_media(
         self,
         db: Session,
+        usage_type: str,
         variant_id: Optional[int] = None,
-        product_id: Optional[int] = None,
-        usage_type: Optional[str] = None
+        product_id: Optional[int] = None
     ) -> None:
-        """Unset is_primary for media matching the criteria"""
-        query = db.query(MediaAsset).filter(MediaAsset.is_primary == True)
-
-        if variant_id:
-            query = query.filter(MediaAsset.variant_id == variant_id)
+        """Unset is_primary for the product's (or else the variant's) media of a usage type"""
         if product_id:
-            query = query.filter(MediaAsset.product_id == product_id)
-        if usage_type:
-            query = query.filter(MediaAsset.usage_type == usage_type)
-
-        query.update({"is_primary": False})
-        db.flush()
+            db.execute(_UNSET_PRIMARY_BY_PRODUCT, {"b_product_id": product_id, "b_usage_type": usage_type})
+        elif variant_id:
+            db.execute(_UNSET_PRIMARY_BY_VARIANT, {"b_variant_id": variant_id, "b_usage_type": usage_type})
 
     def _unset_catalogue_primary_banner(self, db: Session, catalogue_id: int) -> None:
         """Unset primary for catalogue banners"""
-        catalogue = db.query(Catalogue).filter(Catalogue.id == catalogue_id).first()
+        catalogue = db.get(Catalogue, catalogue_id)
         if catalogue:
             catalogue.banner_media_id = None
             db.flush()
@@ -684,11 +1082,18 @@ class MediaUploadService:
     # Health Check
     # ========================
 
-    @staticmethod
-    def check_r2_connection() -> Dict[str, Any]:
-        """Check R2 connection health"""
+    @classmethod
+    async def check_r2_connection(cls) -> Dict[str, Any]:
+        """Check R2 connection health (successful checks are reused for R2_HEALTH_CACHE_SECONDS)"""
+        last_check = cls._last_r2_check
+        if last_check and time.monotonic() - last_check[0] < R2_HEALTH_CACHE_SECONDS:
+            return last_check[1]
+
         try:
-            return r2_client.check_connection()
+            result = await asyncio.to_thread(r2_client.check_connection)
+            if result.get("connected"):
+                cls._last_r2_check = (time.monotonic(), result)
+            return result
         except Exception as e:
             return {
                 "connected": False,
@@ -727,23 +1132,26 @@ class MediaUploadService:
         # Delete old file from R2
         if media.public_id:
             try:
-                r2_client.delete_file(media.public_id)
+                await asyncio.to_thread(r2_client.delete_file, media.public_id)
             except Exception as e:
-                logger.warning(f"Failed to delete old file from R2: {str(e)}")
+                logger.warning("Failed to delete old file from R2: %s", e, exc_info=True)
 
         # Use the same object path (or generate new one with same structure)
         object_path = media.public_id
 
-        # Upload new file
+        # Upload new file (hashed first: the upload leaves the file at EOF)
+        content_sha256 = await self.hash_upload(file)
         upload_result = await self.upload_to_r2(file, object_path)
 
         # Update media record
         media.cloudinary_url = upload_result["public_url"]
         media.public_id = object_path
         media.folder_path = object_path
+        media.content_sha256 = content_sha256
 
-        db.commit()
-        db.refresh(media)
+        sync_primary_image(db, media.product_id)
+        commit_detached(db, media)
+        invalidate_entity_cache("product")
 
         return media
 
@@ -4,14 +4,14 @@ Handles website control center operations: banners, featured sections, media lib
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_, or_, func
 
 from database.db_models import (
     BannerPlacement, FeaturedSection, MediaAssetLibrary, SiteSettings,
     Product, section_products
 )
-from services.catalogue_service import product_to_dict
+from services.catalogue_service import product_to_dict, PRODUCT_LIST_EAGER
 
 
 # ========================
@@ -226,7 +226,7 @@ def delete_section(db: Session, section_id: int) -> bool:
 def get_section(db: Session, section_id: int) -> Optional[FeaturedSection]:
     """Get a single section by ID"""
     return db.query(FeaturedSection).options(
-        joinedload(FeaturedSection.products)
+        selectinload(FeaturedSection.products)
     ).filter(FeaturedSection.id == section_id).first()
 
 
@@ -364,11 +364,9 @@ def get_section_with_products(
 
 def get_auto_populated_products(db: Session, section: FeaturedSection, limit: int) -> List[Product]:
     """Get products based on auto-populate criteria"""
-    query = db.query(Product).options(
-        joinedload(Product.variants),
-        joinedload(Product.media_assets),
-        joinedload(Product.brand),
-    )
+    # Collections are selectin-loaded: joined collections multiplied rows
+    # (variants x media) under the LIMIT
+    query = db.query(Product).options(*PRODUCT_LIST_EAGER)
     
     # Filter by platform/gender if specified
     if section.platform_slug:
@@ -36,7 +36,7 @@ async def get_current_user(
     User data is fetched from Supabase Postgres.
     Use this dependency for any endpoint that requires authentication.
     """
-    return AuthService.get_current_user_from_token(token)
+    return await AuthService.get_current_user_from_token(token)
 
 
 async def get_current_active_user(
@@ -65,7 +65,7 @@ async def get_optional_user(
         return None
 
     try:
-        return AuthService.get_current_user_from_token(credentials.credentials)
+        return await AuthService.get_current_user_from_token(credentials.credentials)
     except HTTPException:
         return None
 
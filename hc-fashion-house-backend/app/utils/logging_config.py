@@ -0,0 +1,51 @@
+"""
+Logging Configuration
+Moves log I/O off the request path: records are queued by a QueueHandler and
+written by a QueueListener's background thread
+"""
+import logging
+import logging.handlers
+import queue
+from typing import List, Optional
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_original_handlers: List[logging.Handler] = []
+
+
+def start_log_listener() -> None:
+    """Route root logger records through a queue drained by a background thread"""
+    global _log_listener, _queue_handler, _original_handlers
+    if _log_listener is not None:
+        return
+
+    root = logging.getLogger()
+    _original_handlers = root.handlers[:]
+    # No handlers configured: write to stderr like logging's last-resort handler
+    handlers = _original_handlers or [logging.StreamHandler()]
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    for handler in _original_handlers:
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+def stop_log_listener() -> None:
+    """Flush queued records and restore the original root handlers"""
+    global _log_listener, _queue_handler, _original_handlers
+    if _log_listener is None:
+        return
+
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    _log_listener.stop()
+    for handler in _original_handlers:
+        root.addHandler(handler)
+
+    _log_listener, _queue_handler, _original_handlers = None, None, []
@@ -3,10 +3,13 @@ Cloudflare R2 Configuration and Utilities
 Handles R2 client setup and image upload operations
 """
 import os
+import re
 import logging
-from typing import Optional, BinaryIO
+from functools import lru_cache
+from typing import List, Optional, BinaryIO
 from pathlib import Path
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from botocore.config import Config
 from dotenv import load_dotenv
@@ -28,6 +31,29 @@ CF_R2_PUBLIC_BASE_URL = os.getenv("HC_CF_BUCKET_PUBLIC_URL")
 if not all([CF_ACCOUNT_ID, CF_ACCESS_KEY_ID, CF_SECRET_ACCESS_KEY, CF_R2_PUBLIC_BASE_URL]):
     logger.warning("Cloudflare R2 credentials not fully configured")
 
+# DeleteObjects accepts at most 1000 keys per request
+R2_DELETE_BATCH_SIZE = 1000
+
+# Streamed uploads: files above the threshold go up as multipart in 8MB
+# parts, so only a few parts are in memory at a time
+R2_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4
+)
+
+# Videos (up to 100MB) get their own multipart settings: anything over one
+# part is split, and a failed part is retried on its own instead of
+# restarting the whole upload. Part size and parallelism are tunable for
+# slow or flaky links
+R2_VIDEO_PART_SIZE_MB = int(os.getenv("HC_CF_VIDEO_PART_SIZE_MB", "20"))
+R2_VIDEO_MAX_CONCURRENT_PARTS = int(os.getenv("HC_CF_VIDEO_MAX_CONCURRENT_PARTS", "4"))
+R2_VIDEO_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=R2_VIDEO_PART_SIZE_MB * 1024 * 1024,
+    multipart_chunksize=R2_VIDEO_PART_SIZE_MB * 1024 * 1024,
+    max_concurrency=R2_VIDEO_MAX_CONCURRENT_PARTS
+)
+
 
 class R2Client:
     """Cloudflare R2 S3-compatible client"""
@@ -61,10 +87,10 @@ class R2Client:
                 )
             )
             
-            logger.info(f"R2 client initialized successfully for bucket: {CF_BUCKET_NAME}")
+            logger.info("R2 client initialized successfully for bucket: %s", CF_BUCKET_NAME)
             
         except Exception as e:
-            logger.error(f"Failed to initialize R2 client: {str(e)}")
+            logger.error("Failed to initialize R2 client: %s", e)
             raise
     
     @property
@@ -109,14 +135,64 @@ class R2Client:
             # Generate public URL
             public_url = f"{CF_R2_PUBLIC_BASE_URL}/{object_path}"
             
-            logger.info(f"Successfully uploaded to R2: {object_path}")
+            logger.info("Successfully uploaded to R2: %s", object_path)
+            return public_url
+            
+        except ClientError as e:
+            logger.error("R2 upload failed for %s: %s", object_path, e)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error during R2 upload: %s", e)
+            raise
+    
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        object_path: str,
+        content_type: str = "image/jpeg",
+        cache_control: str = "public, max-age=31536000"
+    ) -> str:
+        """
+        Stream a file object to R2 bucket (multipart for large files;
+        videos use R2_VIDEO_TRANSFER_CONFIG)
+        
+        Args:
+            fileobj: Readable binary file object (e.g. UploadFile.file)
+            object_path: Relative path in bucket (e.g., "products/footwear/...")
+            content_type: MIME type of the file
+            cache_control: Cache control header
+            
+        Returns:
+            Full public CDN URL
+            
+        Raises:
+            ClientError: If upload fails
+        """
+        try:
+            self.client.upload_fileobj(
+                fileobj,
+                CF_BUCKET_NAME,
+                object_path,
+                ExtraArgs={
+                    "ContentType": content_type,
+                    "CacheControl": cache_control
+                },
+                Config=(
+                    R2_VIDEO_TRANSFER_CONFIG if content_type.startswith("video/")
+                    else R2_TRANSFER_CONFIG
+                )
+            )
+            
+            public_url = f"{CF_R2_PUBLIC_BASE_URL}/{object_path}"
+            
+            logger.info("Successfully uploaded to R2: %s", object_path)
             return public_url
             
         except ClientError as e:
-            logger.error(f"R2 upload failed for {object_path}: {str(e)}")
+            logger.error("R2 upload failed for %s: %s", object_path, e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during R2 upload: {str(e)}")
+            logger.error("Unexpected error during R2 upload: %s", e)
             raise
     
     def delete_file(self, object_path: str) -> bool:
@@ -134,16 +210,46 @@ class R2Client:
                 Bucket=CF_BUCKET_NAME,
                 Key=object_path
             )
-            logger.info(f"Successfully deleted from R2: {object_path}")
+            logger.info("Successfully deleted from R2: %s", object_path)
             return True
             
         except ClientError as e:
-            logger.error(f"R2 delete failed for {object_path}: {str(e)}")
+            logger.error("R2 delete failed for %s: %s", object_path, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error during R2 delete: {str(e)}")
+            logger.error("Unexpected error during R2 delete: %s", e)
             return False
     
+    def delete_files(self, object_paths: List[str]) -> List[str]:
+        """
+        Delete several files from R2 bucket, R2_DELETE_BATCH_SIZE per request
+        
+        Args:
+            object_paths: Relative paths in bucket
+            
+        Returns:
+            Object paths that were deleted
+        """
+        deleted = []
+        for start in range(0, len(object_paths), R2_DELETE_BATCH_SIZE):
+            batch = object_paths[start:start + R2_DELETE_BATCH_SIZE]
+            try:
+                response = self.client.delete_objects(
+                    Bucket=CF_BUCKET_NAME,
+                    Delete={"Objects": [{"Key": key} for key in batch]}
+                )
+                deleted.extend(obj["Key"] for obj in response.get("Deleted", []))
+                for error in response.get("Errors", []):
+                    logger.error("R2 delete failed for %s: %s", error.get("Key"), error.get("Message"))
+                    
+            except ClientError as e:
+                logger.error("R2 bulk delete failed for %s objects: %s", len(batch), e)
+            except Exception as e:
+                logger.error("Unexpected error during R2 bulk delete: %s", e)
+        
+        logger.info("Deleted %s of %s objects from R2", len(deleted), len(object_paths))
+        return deleted
+    
     def file_exists(self, object_path: str) -> bool:
         """
         Check if file exists in R2 bucket
@@ -280,6 +386,29 @@ def generate_global_media_path(
     return f"global/{folder_type}/{clean_name}"
 
 
+# Filename sanitization patterns
+FILENAME_STRIP_PATTERN = re.compile(r'[^a-z0-9-_]')
+HYPHEN_RUN_PATTERN = re.compile(r'-+')
+
+CONTENT_TYPES = {
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+    'svg': 'image/svg+xml',
+    'mp4': 'video/mp4',
+    'webm': 'video/webm',
+    'mov': 'video/quicktime'
+}
+
+ALLOWED_TYPES = {
+    'image': ('jpg', 'jpeg', 'png', 'webp', 'gif'),
+    'video': ('mp4', 'webm', 'mov'),
+}
+
+
+@lru_cache(maxsize=1024)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for storage
@@ -289,8 +418,6 @@ def sanitize_filename(filename: str) -> str:
     - Remove special characters
     - Keep extension
     """
-    import re
-    
     # Split name and extension
     parts = filename.rsplit('.', 1)
     name = parts[0]
@@ -298,8 +425,8 @@ def sanitize_filename(filename: str) -> str:
     
     # Sanitize name
     name = name.lower()
-    name = re.sub(r'[^a-z0-9-_]', '-', name)
-    name = re.sub(r'-+', '-', name)  # Replace multiple hyphens with single
+    name = FILENAME_STRIP_PATTERN.sub('-', name)
+    name = HYPHEN_RUN_PATTERN.sub('-', name)  # Replace multiple hyphens with single
     name = name.strip('-')
     
     # Reconstruct filename
@@ -319,20 +446,7 @@ def get_content_type(filename: str) -> str:
         MIME type string
     """
     ext = filename.lower().split('.')[-1]
-    
-    content_types = {
-        'jpg': 'image/jpeg',
-        'jpeg': 'image/jpeg',
-        'png': 'image/png',
-        'gif': 'image/gif',
-        'webp': 'image/webp',
-        'svg': 'image/svg+xml',
-        'mp4': 'video/mp4',
-        'webm': 'video/webm',
-        'mov': 'video/quicktime'
-    }
-    
-    return content_types.get(ext, 'application/octet-stream')
+    return CONTENT_TYPES.get(ext, 'application/octet-stream')
 
 
 def validate_file_type(filename: str, allowed_types: list) -> bool:
@@ -347,7 +461,13 @@ def validate_file_type(filename: str, allowed_types: list) -> bool:
         True if valid, False otherwise
     """
     ext = filename.lower().split('.')[-1]
-    return ext in [t.lower() for t in allowed_types]
+    return ext in _allowed_type_set(tuple(allowed_types))
+
+
+@lru_cache(maxsize=64)
+def _allowed_type_set(allowed_types: tuple) -> frozenset:
+    """Lowercased allowed extensions, built once per distinct list"""
+    return frozenset(t.lower() for t in allowed_types)
 
 
 def get_allowed_types(media_type: str) -> list:
@@ -360,11 +480,7 @@ def get_allowed_types(media_type: str) -> list:
     Returns:
         List of allowed extensions
     """
-    if media_type == 'image':
-        return ['jpg', 'jpeg', 'png', 'webp', 'gif']
-    elif media_type == 'video':
-        return ['mp4', 'webm', 'mov']
-    return []
+    return list(ALLOWED_TYPES.get(media_type, ()))
 
 
 def extract_object_path_from_url(url: str) -> Optional[str]:
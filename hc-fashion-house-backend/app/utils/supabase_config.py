@@ -3,9 +3,16 @@ Supabase Configuration
 Client setup and helper functions for Supabase Auth
 Uses centralized settings from configs/settings.py
 """
+import threading
+import time
+from importlib.util import find_spec
 from typing import Optional, Dict, Any
 from functools import lru_cache
 
+import httpx
+from cachetools import TTLCache
+from jose import jwt, JWTError
+
 from configs.settings import get_settings
 
 
@@ -20,6 +27,27 @@ _supabase_client = None
 _supabase_admin_client = None
 
 
+def _build_http_client() -> httpx.Client:
+    """
+    Build a pooled keep-alive HTTP client for a Supabase client.
+    Reusing warm connections avoids a TCP + TLS handshake per request.
+    HTTP/2 is used when the h2 package is available.
+    """
+    settings = get_supabase_settings()
+    return httpx.Client(
+        http2=find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.SUPABASE_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.SUPABASE_HTTP_TIMEOUT,
+            connect=settings.SUPABASE_HTTP_CONNECT_TIMEOUT,
+        ),
+    )
+
+
 def get_supabase_client():
     """
     Get Supabase client (anon key - for client-side operations).
@@ -29,9 +57,13 @@ def get_supabase_client():
 
     if _supabase_client is None:
         try:
-            from supabase import create_client, Client
+            from supabase import create_client, ClientOptions
             settings = get_supabase_settings()
-            _supabase_client = create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
+            _supabase_client = create_client(
+                settings.SUPABASE_URL,
+                settings.SUPABASE_ANON_KEY,
+                options=ClientOptions(httpx_client=_build_http_client())
+            )
         except ImportError:
             raise ImportError("supabase package not installed. Run: pip install supabase")
         except Exception as e:
@@ -49,9 +81,13 @@ def get_supabase_admin_client():
 
     if _supabase_admin_client is None:
         try:
-            from supabase import create_client, Client
+            from supabase import create_client, ClientOptions
             settings = get_supabase_settings()
-            _supabase_admin_client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_ROLE_KEY)
+            _supabase_admin_client = create_client(
+                settings.SUPABASE_URL,
+                settings.SUPABASE_SERVICE_ROLE_KEY,
+                options=ClientOptions(httpx_client=_build_http_client())
+            )
         except ImportError:
             raise ImportError("supabase package not installed. Run: pip install supabase")
         except Exception as e:
@@ -60,16 +96,116 @@ def get_supabase_admin_client():
     return _supabase_admin_client
 
 
+# ========================
+# Local JWT Verification
+# ========================
+# Access tokens are verified in-process against the project's signing keys
+# instead of calling the Auth server on every request. Asymmetric keys come
+# from the JWKS endpoint (cached for JWKS_CACHE_TTL_SECONDS); legacy HS256
+# projects need SUPABASE_JWT_SECRET. Anything else falls back to get_user.
+
+JWKS_CACHE_TTL_SECONDS = 600
+JWKS_MIN_REFRESH_SECONDS = 30  # Limits forced refetches on unknown kids
+ASYMMETRIC_ALGORITHMS = ("RS256", "ES256")
+
+_jwks_cache: TTLCache = TTLCache(maxsize=1, ttl=JWKS_CACHE_TTL_SECONDS)
+_jwks_fetched_at = 0.0
+_jwks_lock = threading.Lock()
+
+
+def get_jwks(refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Get the project's public signing keys, keyed by kid"""
+    global _jwks_fetched_at
+
+    with _jwks_lock:
+        keys = _jwks_cache.get("keys")
+        if refresh and time.monotonic() - _jwks_fetched_at >= JWKS_MIN_REFRESH_SECONDS:
+            keys = None
+        if keys is None:
+            _jwks_fetched_at = time.monotonic()
+            settings = get_supabase_settings()
+            try:
+                response = httpx.get(
+                    f"{settings.SUPABASE_URL}/auth/v1/.well-known/jwks.json",
+                    timeout=settings.SUPABASE_HTTP_TIMEOUT
+                )
+                response.raise_for_status()
+                keys = {key["kid"]: key for key in response.json().get("keys", []) if key.get("kid")}
+            except Exception as e:
+                print(f"JWKS fetch failed: {e}")
+                keys = {}
+            _jwks_cache["keys"] = keys
+        return keys
+
+
+def _signing_key(header: Dict[str, Any]) -> Optional[Any]:
+    """Resolve the key to verify a token with, or None if it can't be verified locally"""
+    alg = header.get("alg")
+
+    if alg in ASYMMETRIC_ALGORITHMS:
+        kid = header.get("kid")
+        key = get_jwks().get(kid)
+        if key is None:
+            # Keys may have rotated - refetch once
+            key = get_jwks(refresh=True).get(kid)
+        return key
+
+    if alg == "HS256":
+        return get_supabase_settings().SUPABASE_JWT_SECRET
+
+    return None
+
+
+def _user_info_from_claims(claims: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the verify_jwt_token result from verified token claims"""
+    return {
+        "user_id": str(claims["sub"]),
+        "email": claims.get("email"),
+        "phone": claims.get("phone"),
+        "role": claims.get("role"),
+        "aud": claims.get("aud"),
+        "created_at": None  # Not carried in the access token
+    }
+
+
 def verify_jwt_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify a Supabase JWT token and extract user info.
 
+    Verified locally when the signing key is available, otherwise via
+    the Supabase Auth API.
+
     Args:
         token: JWT access token from Supabase
 
     Returns:
         Dictionary with user info if valid, None otherwise
     """
+    try:
+        header = jwt.get_unverified_header(token)
+        claims = jwt.get_unverified_claims(token)
+    except JWTError:
+        return None
+
+    # Cheap short-circuit for expired tokens - no signature work needed
+    exp = claims.get("exp")
+    if exp is not None and exp <= time.time():
+        return None
+
+    key = _signing_key(header)
+    if key is not None:
+        try:
+            verified = jwt.decode(
+                token,
+                key,
+                algorithms=[header["alg"]],
+                options={"verify_aud": False}
+            )
+            return _user_info_from_claims(verified) if verified.get("sub") else None
+        except JWTError as e:
+            print(f"JWT verification failed: {e}")
+            return None
+
     try:
         # Use the Supabase client to verify
         client = get_supabase_client()
@@ -97,7 +233,6 @@ def decode_jwt_payload(token: str) -> Optional[Dict[str, Any]]:
     DO NOT use this for authentication - use verify_jwt_token instead.
     """
     try:
-        from jose import jwt
         # Decode without verification - ONLY for debugging
         payload = jwt.get_unverified_claims(token)
         return payload
@@ -15,6 +15,12 @@ SKU_PATTERN = re.compile(r'^[A-Z0-9]+(?:-[A-Z0-9]+)*$')
 # Color hex code pattern
 HEX_COLOR_PATTERN = re.compile(r'^#[0-9A-Fa-f]{6}$')
 
+# Normalization patterns used by sanitize_string / generate_slug
+CONTROL_CHAR_PATTERN = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+SLUG_STRIP_PATTERN = re.compile(r'[^\w\s-]')
+SLUG_SEPARATOR_PATTERN = re.compile(r'[\s_]+')
+DASH_RUN_PATTERN = re.compile(r'-+')
+
 
 def validate_slug(slug: str) -> bool:
     """
@@ -70,7 +76,7 @@ def sanitize_string(value: str, max_length: int = 255) -> str:
         return value
 
     # Remove control characters
-    value = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', value)
+    value = CONTROL_CHAR_PATTERN.sub('', value)
     # Strip whitespace
     value = value.strip()
     # Truncate
@@ -91,11 +97,11 @@ def generate_slug(name: str) -> str:
 
     slug = name.lower().strip()
     # Remove special characters except hyphens and spaces
-    slug = re.sub(r'[^\w\s-]', '', slug)
+    slug = SLUG_STRIP_PATTERN.sub('', slug)
     # Replace spaces and underscores with hyphens
-    slug = re.sub(r'[\s_]+', '-', slug)
+    slug = SLUG_SEPARATOR_PATTERN.sub('-', slug)
     # Collapse multiple hyphens
-    slug = re.sub(r'-+', '-', slug)
+    slug = DASH_RUN_PATTERN.sub('-', slug)
     # Remove leading/trailing hyphens
     return slug.strip('-')
 